@@ -1,9 +1,25 @@
-from .ecs import *
-from .s3 import *
-from .iam import *
-from .ec2 import *
-from .ecr import *
-from .codepipeline import *
-from .codebuild import *
-from .vpc import *
-from .cloudfront import *
\ No newline at end of file
+import importlib
+
+# Sub-apps are resolved lazily (PEP 562): importing this package used to
+# star-import every service module, so any single command paid the import
+# bill for all of them.
+_COMMAND_MODULES = {
+    'cloudfront_command': 'cloudfront',
+    'codebuild_command': 'codebuild',
+    'codepipeline_command': 'codepipeline',
+    'dynamodb_command': 'dynamodb',
+    'ec2_command': 'ec2',
+    'ecr_command': 'ecr',
+    'ecs_command': 'ecs',
+    'iam_command': 'iam',
+    'multi_command': 'multi',
+    's3_command': 's3',
+    'vpc_command': 'vpc',
+}
+
+
+def __getattr__(name):
+    module_name = _COMMAND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f'.{module_name}', __name__), name)
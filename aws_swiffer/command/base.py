@@ -1,23 +1,46 @@
-from abc import ABC
-from typing import Type, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Iterable, Optional
 import os
 
+from typer import Typer, Argument
+from typing_extensions import Annotated
+
 from aws_swiffer.factory.IFactory import IFactory
 from aws_swiffer.resources.IResource import IResource
-from aws_swiffer.utils import get_logger, ExecutionContext
+from aws_swiffer.utils import get_logger, get_tags, ExecutionContext
+
+_TRUTHY = frozenset({'true', '1', 'yes', 'on'})
+
+
+@dataclass(slots=True)
+class RemovalResult:
+    """Outcome of a single resource removal in a batch."""
+    ok: bool
+    arn: str
+    error: Optional[BaseException] = None
+
+
+def _env_bool(name: str) -> bool:
+    """Read an environment variable as a boolean flag."""
+    return os.environ.get(name, '').lower() in _TRUTHY
 
 
-class BaseCommand(ABC):
+class BaseCommand:
     """
     Base class for AWS service commands providing standardized operations.
-    
+
     Attributes:
         factory: Factory instance for creating resources
         context: ExecutionContext for operation configuration
         logger: Logger instance for the command
     """
-    
-    def __init__(self, factory: Type[IFactory], logger_name: str = None):
+
+    # Concrete class: nothing abstract is left, and slots keep instances small
+    __slots__ = ('factory', 'context', 'logger')
+
+    def __init__(self, factory: IFactory, logger_name: str = None):
         """
         Initialize BaseCommand with a factory.
         
@@ -42,8 +65,8 @@ class BaseCommand(ABC):
         """
         # Prefer explicit parameters, fall back to environment
         self.context = ExecutionContext(
-            dry_run=dry_run or os.getenv('DRY_RUN', 'false').lower() == 'true',
-            auto_approve=auto_approve or os.getenv('AUTO_APPROVE', 'false').lower() == 'true',
+            dry_run=dry_run or _env_bool('DRY_RUN'),
+            auto_approve=auto_approve or _env_bool('AUTO_APPROVE'),
             region=region or os.getenv('AWS_REGION'),
             profile=profile or os.getenv('AWS_PROFILE')
         )
@@ -77,7 +100,6 @@ class BaseCommand(ABC):
         """
         self.logger.info(f"Search resources by tags: {tags}")
         resources = self.factory.create_by_tags(tags)
-        self.logger.info(f"Found {len(resources)} resources")
         self._execute_batch_removal(resources)
     
     def remove_by_file_list(self, file_path: str) -> None:
@@ -89,7 +111,6 @@ class BaseCommand(ABC):
         """
         self.logger.info(f"Loading resources from file: {file_path}")
         resources = self.factory.create_by_file_list(file_path)
-        self.logger.info(f"Found {len(resources)} resources in file")
         self._execute_batch_removal(resources)
     
     def _execute_removal(self, resource: IResource) -> None:
@@ -108,30 +129,89 @@ class BaseCommand(ABC):
             self.logger.error(f"Failed to remove resource {resource.arn}: {e}")
             raise
     
-    def _execute_batch_removal(self, resources: list[Type[IResource]]) -> None:
+    def register(self, app: Typer, resource_name: str,
+                 tags_command: str = None, name_command: str = None) -> Typer:
+        """
+        Register the standard remove-by-tags and remove-by-name commands.
+
+        Replaces the near-identical hand-written command bodies in the service
+        modules with a single implementation backed by this command class.
+
+        Args:
+            app: Typer application to register the commands on
+            resource_name: Resource name used to build default command names
+            tags_command: Optional override for the by-tags command name
+            name_command: Optional override for the by-name command name
+
+        Returns:
+            The Typer application, for chaining
+        """
+        # Kebab-case to match Typer's default command naming, so the generated
+        # commands keep the names the hand-written functions produced
+        tags_command = (tags_command or f"remove_{resource_name}_by_tags").replace('_', '-')
+        name_command = (name_command or f"remove_{resource_name}_by_name").replace('_', '-')
+
+        @app.command(name=tags_command, help=f"Find {resource_name} by tags and remove each match.")
+        def remove_by_tags(tags: Annotated[str, Argument(help="You can provide JSON tag list or use GUI for choose "
+                                                              "selection tags.")] = None):
+            self.setup_context()
+            self.remove_by_tags(get_tags(tags))
+
+        @app.command(name=name_command, help=f"Remove a {resource_name} by name.")
+        def remove_by_name(name: str):
+            self.setup_context()
+            self.remove_by_name(name)
+
+        return app
+
+    def _safe_remove(self, resource: IResource) -> RemovalResult:
+        """
+        Remove a single resource, capturing any error instead of raising.
+
+        Args:
+            resource: Resource to remove
+
+        Returns:
+            RemovalResult with the outcome
+        """
+        prefix = self.context.log_prefix() if self.context else ""
+        # %-style args defer formatting until the record is actually emitted
+        self.logger.info("%sProcessing resource: %s", prefix, resource.arn)
+        try:
+            resource.remove(context=self.context)
+        except Exception as e:
+            return RemovalResult(ok=False, arn=resource.arn, error=e)
+        return RemovalResult(ok=True, arn=resource.arn)
+
+    def _execute_batch_removal(self, resources: Iterable[IResource]) -> None:
         """
         Execute removal of multiple resources with error handling and summary.
-        
+
+        Removals are I/O bound AWS calls, so they run concurrently in a bounded
+        thread pool. The pool size can be tuned via ExecutionContext.max_workers.
+        Accepts any iterable: factories stream resources page by page, so the
+        first removals start before discovery has finished.
+
         Args:
-            resources: List of resources to remove
+            resources: Resources to remove
         """
-        if not resources:
+        prefix = self.context.log_prefix() if self.context else ""
+        outcomes = Counter()
+
+        max_workers = self.context.max_workers if self.context and self.context.max_workers else 32
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._safe_remove, resource) for resource in resources]
+            for future in as_completed(futures):
+                result = future.result()
+                outcomes[result.ok] += 1
+                if not result.ok:
+                    self.logger.error("Failed to remove resource %s: %s", result.arn, result.error)
+
+        if not outcomes:
             self.logger.info("No resources to process")
             return
-        
-        prefix = self.context.log_prefix() if self.context else ""
-        success_count = 0
-        failure_count = 0
-        
-        for resource in resources:
-            try:
-                self.logger.info(f"{prefix}Processing resource: {resource.arn}")
-                resource.remove(context=self.context)
-                success_count += 1
-            except Exception as e:
-                self.logger.error(f"Failed to remove resource {resource.arn}: {e}")
-                failure_count += 1
-                # Continue processing remaining resources
-        
+
         # Summary logging
-        self.logger.info(f"{prefix}Batch operation complete: {success_count} succeeded, {failure_count} failed")
+        self.logger.info("%sBatch operation complete: %s succeeded, %s failed",
+                         prefix, outcomes[True], outcomes[False])
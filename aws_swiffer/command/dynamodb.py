@@ -1,5 +1,4 @@
 from typer import Typer, Argument
-from aws_swiffer.factory.dynamodb.TableFactory import TableFactory
 from aws_swiffer.utils import get_logger, get_tags, callback_check_account
 from typing_extensions import Annotated
 
@@ -21,6 +20,7 @@ def remove_table_by_name(name: str):
     """
     Empty and delete dynamodb table
     """
+    from aws_swiffer.factory.dynamodb.TableFactory import TableFactory
     table = TableFactory().create_by_name(name=name)
     table.remove()
 
@@ -30,6 +30,7 @@ def remove_table_by_file_list(file_path: str):
     """
     Empty and delete dynamodb tables in file list
     """
+    from aws_swiffer.factory.dynamodb.TableFactory import TableFactory
     logger.info(f"Taking DYNAMODB tables tables from file")
     tables = TableFactory().create_by_file_list(file_path=file_path)
     for table in tables:
@@ -42,12 +43,14 @@ def remove_table_by_tags(tags: Annotated[str, Argument(help="You can provide JSO
     """
     Find dynamodb tables by tags, and for each dynamodb empty and delete it.
     """
+    from aws_swiffer.factory.dynamodb.TableFactory import TableFactory
     tags = get_tags(tags)
     logger.info(f"Search DYNAMODB tables by tags: \n{tags}")
-    tables = TableFactory().create_by_tags(tags=tags)
-    logger.info(f"Found {len(tables)} Tables")
-    for t in tables:
+    count = 0
+    for t in TableFactory().create_by_tags(tags=tags):
         t.remove()
+        count += 1
+    logger.info(f"Processed {count} Tables")
 
 
 @dynamodb_command.command()
@@ -55,6 +58,7 @@ def clean_table_by_name(name: str):
     """
     Clean dynamodb tables by name
     """
+    from aws_swiffer.factory.dynamodb.TableFactory import TableFactory
     table = TableFactory().create_by_name(name=name)
     table.clean()
 
@@ -65,12 +69,14 @@ def clean_table_by_tags(tags: Annotated[str, Argument(help="You can provide JSON
     """
     Clean dynamodb tables select by tags
     """
+    from aws_swiffer.factory.dynamodb.TableFactory import TableFactory
     tags = get_tags(tags)
     logger.info(f"Search DYNAMODB tables by tags: \n{tags}")
-    tables = TableFactory().create_by_tags(tags=tags)
-    logger.info(f"Found {len(tables)} Buckets")
-    for t in tables:
+    count = 0
+    for t in TableFactory().create_by_tags(tags=tags):
         t.clean()
+        count += 1
+    logger.info(f"Processed {count} Tables")
 
 
 @dynamodb_command.command()
@@ -78,6 +84,7 @@ def clean_table_by_file_list(file_path: str):
     """
     Clean dynamodb tables select by file list
     """
+    from aws_swiffer.factory.dynamodb.TableFactory import TableFactory
     logger.info(f"Taking DYNAMODB tables from file")
     tables = TableFactory().create_by_file_list(file_path=file_path)
     for t in tables:
@@ -1,5 +1,4 @@
 from typer import Typer
-from aws_swiffer.factory.ec2 import InstanceFactory
 from aws_swiffer.utils import callback_check_account
 
 
@@ -17,5 +16,26 @@ ec2_command = Typer(callback=callback)
 
 @ec2_command.command()
 def remove_instance_by_id(resource_id: str):
+    from aws_swiffer.factory.ec2 import InstanceFactory
     instance = InstanceFactory().create_by_id(resource_id)
     instance.remove()
+
+
+@ec2_command.command()
+def remove_instances_by_ids(resource_ids: str):
+    """
+    Terminate multiple instances, batching up to 1000 IDs per TerminateInstances call.
+    :param resource_ids: whitespace or comma separated instance IDs
+    :return:
+    """
+    from aws_swiffer.resources.ec2.Instance import Instance
+    from aws_swiffer.utils import ask_delete_confirm
+    from aws_swiffer.utils.context import ExecutionContext
+
+    ids = [i for i in resource_ids.replace(',', ' ').split() if i]
+    if not ids:
+        return
+    context = ExecutionContext.get_context()
+    if not context.dry_run and not ask_delete_confirm(f"{len(ids)} EC2 instances", context):
+        return
+    Instance.remove_many(ids, context=context)
@@ -1,8 +1,8 @@
 from typer import Typer
-from aws_swiffer.factory.ecr import EcrFactory
-from aws_swiffer.utils import get_logger, get_tags, callback_check_account
 
-logger = get_logger('ECR')
+from aws_swiffer.command.base import BaseCommand
+from aws_swiffer.factory.ecr import EcrFactory
+from aws_swiffer.utils import callback_check_account
 
 
 def callback(profile: str = None, region: str = 'eu-west-1', skip_account_check: bool = False):
@@ -12,20 +12,4 @@ def callback(profile: str = None, region: str = 'eu-west-1', skip_account_check:
     callback_check_account(profile=profile, region=region, skip_account_check=skip_account_check)
 
 
-ecr_command = Typer(callback=callback)
-
-
-@ecr_command.command()
-def remove_ecr_by_tags(tags: str = None):
-    tags = get_tags(tags)
-    logger.info(f"Search ECR repositories by tags: \n{tags}")
-    ecr_repositories = EcrFactory().create_by_tags(tags=tags)
-    logger.info(f"Found {len(ecr_repositories)} ECR repositories")
-    for e in ecr_repositories:
-        e.remove()
-
-
-@ecr_command.command()
-def remove_ecr_by_name(name: str):
-    ecr = EcrFactory().create_by_name(name=name)
-    ecr.remove()
+ecr_command = BaseCommand(EcrFactory(), 'ECR').register(Typer(callback=callback), 'ecr')
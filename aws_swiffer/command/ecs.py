@@ -1,5 +1,4 @@
 from typer import Typer
-from aws_swiffer.factory.ecs import TaskDefinitionFactory, ServiceFactory, ClusterFactory
 from aws_swiffer.utils import get_logger, get_tags, callback_check_account
 
 logger = get_logger('ECS')
@@ -19,44 +18,64 @@ ecs_command = Typer(callback=callback)
 def remove_task_definitions_by_tags(tags: str = None):
     tags = get_tags(tags)
 
+    from aws_swiffer.factory.ecs import TaskDefinitionFactory
+    from aws_swiffer.resources.ecs import TaskDefinition
     logger.info(f"Search task definitions by tags: \n{tags}")
-    task_definitions = TaskDefinitionFactory().create_by_tags(tags=tags)
-    logger.info(f"Found {len(task_definitions)} task definitions")
-    for td in task_definitions:
-        td.remove()
+    # Batched removal: concurrent deregistrations plus one delete call per 10
+    task_definitions = [td.task_definition for td in TaskDefinitionFactory().create_by_tags(tags=tags)]
+    if task_definitions:
+        TaskDefinition.remove_many(task_definitions)
+    logger.info(f"Processed {len(task_definitions)} task definitions")
 
 
 @ecs_command.command()
 def remove_service_by_tags(tags: str = None):
     tags = get_tags(tags)
 
+    from aws_swiffer.factory.ecs import ServiceFactory
     logger.info(f"Search ECS services by tags: \n{tags}")
-    ecs_services = ServiceFactory().create_by_tags(tags=tags)
-    logger.info(f"Found {len(ecs_services)} services")
-    for s in ecs_services:
+    count = 0
+    for s in ServiceFactory().create_by_tags(tags=tags):
         s.remove()
+        count += 1
+    logger.info(f"Processed {count} services")
 
 
 @ecs_command.command()
 def remove_service_by_arn(arn: str):
+    from aws_swiffer.factory.ecs import ServiceFactory
     service = ServiceFactory().create_by_arn(arn=arn)
     service.remove()
 
 
 @ecs_command.command()
 def remove_service_by_arns(arn: str):
-    arn = arn.split(' ')
-    print(arn)
-    for arn in arn:
-        service = ServiceFactory().create_by_arn(arn=arn)
-        service.remove()
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from aws_swiffer.factory.ecs import ServiceFactory
+
+    arns = [a for a in arn.split() if a]
+    logger.info(f"Removing {len(arns)} ECS services")
+    factory = ServiceFactory()
+    failures = 0
+    with ThreadPoolExecutor(max_workers=min(16, len(arns) or 1)) as executor:
+        futures = {executor.submit(lambda a: factory.create_by_arn(arn=a).remove(), a): a for a in arns}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Failed to remove service {futures[future]}: {e}")
+                failures += 1
+    logger.info(f"Removal complete: {len(arns) - failures} succeeded, {failures} failed")
 
 
 @ecs_command.command()
 def remove_ecs_cluster_by_tags(tags: str = None):
     tags = get_tags(tags)
+    from aws_swiffer.factory.ecs import ClusterFactory
     logger.info(f"Search ECS Clusters by tags: \n{tags}")
-    ecs_clusters = ClusterFactory().create_by_tags(tags=tags)
-    logger.info(f"Found {len(ecs_clusters)} clusters")
-    for s in ecs_clusters:
+    count = 0
+    for s in ClusterFactory().create_by_tags(tags=tags):
         s.remove()
+        count += 1
+    logger.info(f"Processed {count} clusters")
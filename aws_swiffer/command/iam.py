@@ -1,5 +1,4 @@
 from typer import Typer
-from aws_swiffer.factory.iam import GroupFactory, UserFactory, PolicyFactory
 from aws_swiffer.utils import get_logger, get_tags, callback_check_account
 
 logger = get_logger('IAM')
@@ -17,18 +16,21 @@ iam_command = Typer(callback=callback)
 
 @iam_command.command()
 def remove_iam_group_by_name(name: str):
+    from aws_swiffer.factory.iam import GroupFactory
     group = GroupFactory().create_by_name(name=name)
     group.remove()
 
 
 @iam_command.command()
 def remove_iam_user_by_name(name: str):
+    from aws_swiffer.factory.iam import UserFactory
     user = UserFactory().create_by_name(name=name)
     user.remove()
 
 
 @iam_command.command()
 def remove_iam_policy_by_name(name: str):
+    from aws_swiffer.factory.iam import PolicyFactory
     policy = PolicyFactory().create_by_name(name=name)
     policy.remove()
 
@@ -36,10 +38,13 @@ def remove_iam_policy_by_name(name: str):
 @iam_command.command()
 def remove_iam_policy_by_tags(tags: str = None):
 
+    from aws_swiffer.factory.iam import PolicyFactory
+
     tags = get_tags(tags)
 
     logger.info(f"Search IAM policies by tags: \n{tags}")
-    policies = PolicyFactory().create_by_tags(tags=tags)
-    logger.info(f"Found {len(policies)} policies")
-    for s in policies:
+    count = 0
+    for s in PolicyFactory().create_by_tags(tags=tags):
         s.remove()
+        count += 1
+    logger.info(f"Processed {count} policies")
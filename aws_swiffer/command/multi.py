@@ -0,0 +1,104 @@
+from typer import Typer, Argument, BadParameter
+from typing_extensions import Annotated
+
+from aws_swiffer.utils import get_logger, get_tags, callback_check_account
+
+logger = get_logger('MULTI')
+
+
+def callback(profile: str = None, region: str = 'eu-west-1', skip_account_check: bool = False,
+             dry_run: bool = False, auto_approve: bool = False):
+    """
+    Clean resources across services
+    """
+    callback_check_account(profile=profile, region=region, skip_account_check=skip_account_check,
+                           dry_run=dry_run, auto_approve=auto_approve)
+
+
+multi_command = Typer(callback=callback)
+
+
+def _resource_classes():
+    """Map tagging-API resource types to the resource classes that remove them."""
+    from aws_swiffer.resources.cloudfront.Distribution import Distribution
+    from aws_swiffer.resources.codebuild import Project
+    from aws_swiffer.resources.codepipeline import Codepipeline
+    from aws_swiffer.resources.dynamodb import Table
+    from aws_swiffer.resources.ecr import Ecr
+    from aws_swiffer.resources.ecs import Cluster, Service, TaskDefinition
+    from aws_swiffer.resources.s3.Bucket import Bucket
+
+    return {
+        'cloudfront:distribution': Distribution,
+        'codebuild:project': Project,
+        'codepipeline': Codepipeline,
+        'dynamodb:table': Table,
+        'ecr:repository': Ecr,
+        'ecs:cluster': Cluster,
+        'ecs:service': Service,
+        'ecs:task-definition': TaskDefinition,
+        's3': Bucket,
+    }
+
+
+def _build_resource(name: str = '', arn: str = '', tags: list = None):
+    """Build the right resource class from the service and type segments of an ARN."""
+    classes = _resource_classes()
+    parts = arn.split(':')
+    service = parts[2]
+    if len(parts) > 5:
+        resource_type = parts[5].split('/')[0]
+        if f'{service}:{resource_type}' in classes:
+            return classes[f'{service}:{resource_type}'](name=name, arn=arn, tags=tags)
+    return classes[service](name=name, arn=arn, tags=tags)
+
+
+def _remove_concurrently(resources):
+    """Remove resources from a thread pool and log a success/failure summary."""
+    from aws_swiffer.utils import bulk_remove
+    from aws_swiffer.utils.context import ExecutionContext
+
+    bulk_remove(resources, context=ExecutionContext.get_context())
+
+
+@multi_command.command()
+def remove_delivery_resources_by_tags(tags: Annotated[str, Argument(help="You can provide JSON tag list or use GUI "
+                                                                         "for choose selection tags.")] = None):
+    """
+    Find CodePipeline pipelines, CodeBuild projects and ECR repositories with a
+    single tag search and remove them all.
+    """
+    from aws_swiffer.factory import get_resources_by_tags
+
+    tags = get_tags(tags)
+    logger.info(f"Search delivery resources by tags: \n{tags}")
+    resource_type_filters = ['codepipeline:pipeline', 'codebuild:project', 'ecr:repository']
+    resources = get_resources_by_tags(tags=tags, resource_type_filters=resource_type_filters,
+                                      resource_class=_build_resource)
+    _remove_concurrently(resources)
+
+
+@multi_command.command()
+def remove_resources_by_tags(resource_types: Annotated[str, Argument(help="Space or comma separated tagging API "
+                                                                          "resource types, e.g. 'ecr:repository "
+                                                                          "ecs:cluster dynamodb:table'.")],
+                             tags: Annotated[str, Argument(help="You can provide JSON tag list or use GUI for choose "
+                                                                "selection tags.")] = None):
+    """
+    Find resources of the given types with a single tag search and remove them
+    all concurrently, instead of running one command per service.
+    """
+    from aws_swiffer.factory import get_resources_by_tags
+
+    resource_type_filters = [t for t in resource_types.replace(',', ' ').split() if t]
+    supported = _resource_classes()
+    unsupported = [t for t in resource_type_filters if t not in supported and t.split(':')[0] not in supported]
+    if unsupported:
+        raise BadParameter(f"unsupported resource types: {', '.join(unsupported)}. "
+                           f"Supported: {', '.join(sorted(supported))}")
+
+    tags = get_tags(tags)
+    logger.info(f"Search {', '.join(resource_type_filters)} resources by tags: \n{tags}")
+    resources = get_resources_by_tags(tags=tags, resource_type_filters=resource_type_filters,
+                                      resource_class=_build_resource)
+    _remove_concurrently(resources)
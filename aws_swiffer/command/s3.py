@@ -1,5 +1,4 @@
 from typer import Typer, Argument
-from aws_swiffer.factory.s3.BucketFactory import BucketFactory
 from aws_swiffer.utils import get_logger, get_tags, callback_check_account
 from typing_extensions import Annotated
 
@@ -25,6 +24,7 @@ def remove_bucket_by_name(name: str):
     :param name: bucket name
     :return:
     """
+    from aws_swiffer.factory.s3.BucketFactory import BucketFactory
     s3 = BucketFactory().create_by_name(name=name)
     s3.remove()
 
@@ -36,10 +36,12 @@ def remove_bucket_by_file_list(file_path: str):
     :param file_path:
     :return:
     """
+    from aws_swiffer.factory.s3.BucketFactory import BucketFactory
+    from aws_swiffer.utils import bulk_remove
+    from aws_swiffer.utils.context import ExecutionContext
     logger.info(f"Taking S3 buckets from file")
     buckets = BucketFactory().create_by_file_list(file_path=file_path)
-    for bucket in buckets:
-        bucket.remove()
+    bulk_remove(buckets, context=ExecutionContext.get_context())
 
 
 @s3_command.command()
@@ -48,12 +50,14 @@ def remove_bucket_by_tags(tags: Annotated[str, Argument(help="You can provide JS
     """
     Find bucket by tags, and for each bucket empty and delete it.
     """
+    from aws_swiffer.factory.s3.BucketFactory import BucketFactory
+    from aws_swiffer.utils import bulk_remove
+    from aws_swiffer.utils.context import ExecutionContext
     tags = get_tags(tags)
     logger.info(f"Search S3 buckets by tags: \n{tags}")
-    buckets = BucketFactory().create_by_tags(tags=tags)
-    logger.info(f"Found {len(buckets)} Buckets")
-    for s in buckets:
-        s.remove()
+    # Buckets are independent, so they empty and delete in parallel; each
+    # bucket's own object deletion stays concurrent inside clean()
+    bulk_remove(BucketFactory().create_by_tags(tags=tags), context=ExecutionContext.get_context())
 
 
 @s3_command.command()
@@ -63,6 +67,7 @@ def clean_bucket_by_name(name: str):
     :param name: bucket name
     :return:
     """
+    from aws_swiffer.factory.s3.BucketFactory import BucketFactory
     s3 = BucketFactory().create_by_name(name=name)
     s3.remove()
 
@@ -73,12 +78,14 @@ def clean_bucket_by_tags(tags: Annotated[str, Argument(help="You can provide JSO
     """
     Find bucket by tags, and for each bucket empty it
     """
+    from aws_swiffer.factory.s3.BucketFactory import BucketFactory
     tags = get_tags(tags)
     logger.info(f"Search S3 buckets by tags: \n{tags}")
-    buckets = BucketFactory().create_by_tags(tags=tags)
-    logger.info(f"Found {len(buckets)} Buckets")
-    for s in buckets:
+    count = 0
+    for s in BucketFactory().create_by_tags(tags=tags):
         s.clean()
+        count += 1
+    logger.info(f"Processed {count} Buckets")
 
 
 @s3_command.command()
@@ -88,6 +95,7 @@ def clean_bucket_by_file_list(file_path: str):
     :param file_path:
     :return:
     """
+    from aws_swiffer.factory.s3.BucketFactory import BucketFactory
     logger.info(f"Taking S3 buckets from file")
     buckets = BucketFactory().create_by_file_list(file_path=file_path)
     for s in buckets:
@@ -1,14 +1,22 @@
 """VPC Command module for AWS Swiffer."""
 
-import os
 from typing import Dict, Optional
 
-from typer import Typer, Option
+from typer import Typer, Option, BadParameter
 from aws_swiffer.command.base import BaseCommand
-from aws_swiffer.factory.vpc.VPCFactory import VPCFactory, VPCResourceCollection
 from aws_swiffer.utils import get_logger, callback_check_account
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
+
+
+def _stub(method):
+    """Mark a cleanup method whose implementation has not landed yet.
+
+    Handlers check the flag before building the command object, so invoking an
+    unimplemented command never constructs the factory or its EC2 client.
+    """
+    method._is_stub = True
+    return method
 
 
 class VPCCommand(BaseCommand):
@@ -16,8 +24,12 @@ class VPCCommand(BaseCommand):
     
     def __init__(self):
         """Initialize VPC command with VPC factory."""
-        super().__init__(VPCFactory, "VPC_COMMAND")
+        # Imported lazily so listing commands or printing --help never pays
+        # for the factory module (and the boto3 client it builds)
+        from aws_swiffer.factory.vpc.VPCFactory import VPCFactory
+        super().__init__(VPCFactory(), "VPC_COMMAND")
     
+    @_stub
     def bulk_cleanup(self, vpc_id: str, include_vpc: bool = False, 
                     tags: Optional[Dict[str, str]] = None) -> None:
         """
@@ -37,6 +49,7 @@ class VPCCommand(BaseCommand):
         # This will be implemented in subsequent tasks
         logger.info("Bulk cleanup implementation pending")
     
+    @_stub
     def cleanup_subnets(self, vpc_id: str, tags: Optional[Dict[str, str]] = None) -> None:
         """
         Clean only subnets in a VPC.
@@ -50,6 +63,7 @@ class VPCCommand(BaseCommand):
         # TODO: Implement subnet cleanup
         logger.info("Subnet cleanup implementation pending")
     
+    @_stub
     def cleanup_security_groups(self, vpc_id: str, tags: Optional[Dict[str, str]] = None) -> None:
         """
         Clean only security groups in a VPC.
@@ -63,6 +77,7 @@ class VPCCommand(BaseCommand):
         # TODO: Implement security group cleanup
         logger.info("Security group cleanup implementation pending")
     
+    @_stub
     def cleanup_route_tables(self, vpc_id: str, tags: Optional[Dict[str, str]] = None) -> None:
         """
         Clean only route tables in a VPC.
@@ -76,6 +91,7 @@ class VPCCommand(BaseCommand):
         # TODO: Implement route table cleanup
         logger.info("Route table cleanup implementation pending")
     
+    @_stub
     def cleanup_network_acls(self, vpc_id: str, tags: Optional[Dict[str, str]] = None) -> None:
         """
         Clean only network ACLs in a VPC.
@@ -89,6 +105,7 @@ class VPCCommand(BaseCommand):
         # TODO: Implement network ACL cleanup
         logger.info("Network ACL cleanup implementation pending")
     
+    @_stub
     def cleanup_nat_gateways(self, vpc_id: str, tags: Optional[Dict[str, str]] = None) -> None:
         """
         Clean only NAT gateways in a VPC.
@@ -102,6 +119,7 @@ class VPCCommand(BaseCommand):
         # TODO: Implement NAT gateway cleanup
         logger.info("NAT gateway cleanup implementation pending")
     
+    @_stub
     def cleanup_vpc_endpoints(self, vpc_id: str, tags: Optional[Dict[str, str]] = None) -> None:
         """
         Clean only VPC endpoints in a VPC.
@@ -115,6 +133,7 @@ class VPCCommand(BaseCommand):
         # TODO: Implement VPC endpoint cleanup
         logger.info("VPC endpoint cleanup implementation pending")
     
+    @_stub
     def cleanup_network_interfaces(self, vpc_id: str, tags: Optional[Dict[str, str]] = None) -> None:
         """
         Clean only network interfaces in a VPC.
@@ -141,164 +160,83 @@ def callback(profile: str = None, region: str = 'us-east-1', skip_account_check:
 
 vpc_command = Typer(callback=callback)
 
+_TAGS_HELP = "Filter resources by tags (format: key1=value1,key2=value2)"
 
-@vpc_command.command()
-def bulk_cleanup(
-    vpc_id: str = Option(..., "--vpc-id", help="VPC ID to clean up"),
-    include_vpc: bool = Option(False, "--include-vpc", help="Delete the VPC itself after cleaning resources"),
-    tags: str = Option(None, "--tags", help="Filter resources by tags (format: key1=value1,key2=value2)")
-):
-    """Clean all resources in a VPC."""
-    cmd = VPCCommand()
-    cmd.setup_context()  # This will be set up properly when integrated with main callback
-    
-    # Parse tags if provided
-    parsed_tags = None
-    if tags:
-        try:
-            parsed_tags = dict(tag.split('=') for tag in tags.split(','))
-        except ValueError:
-            logger.error("Invalid tag format. Use: key1=value1,key2=value2")
-            return
-    
-    cmd.bulk_cleanup(vpc_id=vpc_id, include_vpc=include_vpc, tags=parsed_tags)
+# One entry per cleanup command: (resource description, VPCCommand method name).
+# Commands are registered from this table so the option parsing and command
+# wiring exist once instead of once per resource type.
+CLEANUP_OPS = [
+    ("subnets", "cleanup_subnets"),
+    ("security groups", "cleanup_security_groups"),
+    ("route tables", "cleanup_route_tables"),
+    ("network ACLs", "cleanup_network_acls"),
+    ("NAT gateways", "cleanup_nat_gateways"),
+    ("VPC endpoints", "cleanup_vpc_endpoints"),
+    ("network interfaces", "cleanup_network_interfaces"),
+]
 
+_cmd: Optional[VPCCommand] = None
 
-@vpc_command.command()
-def cleanup_subnets(
-    vpc_id: str = Option(..., "--vpc-id", help="VPC ID"),
-    tags: str = Option(None, "--tags", help="Filter resources by tags (format: key1=value1,key2=value2)")
-):
-    """Clean only subnets in a VPC."""
-    cmd = VPCCommand()
-    cmd.setup_context()
-    
-    parsed_tags = None
-    if tags:
-        try:
-            parsed_tags = dict(tag.split('=') for tag in tags.split(','))
-        except ValueError:
-            logger.error("Invalid tag format. Use: key1=value1,key2=value2")
-            return
-    
-    cmd.cleanup_subnets(vpc_id=vpc_id, tags=parsed_tags)
 
+def _get_command() -> VPCCommand:
+    """Return the shared VPCCommand, building it on first use."""
+    global _cmd
+    if _cmd is None:
+        _cmd = VPCCommand()
+        _cmd.setup_context()
+    return _cmd
 
-@vpc_command.command()
-def cleanup_security_groups(
-    vpc_id: str = Option(..., "--vpc-id", help="VPC ID"),
-    tags: str = Option(None, "--tags", help="Filter resources by tags (format: key1=value1,key2=value2)")
-):
-    """Clean only security groups in a VPC."""
-    cmd = VPCCommand()
-    cmd.setup_context()
-    
-    parsed_tags = None
-    if tags:
-        try:
-            parsed_tags = dict(tag.split('=') for tag in tags.split(','))
-        except ValueError:
-            logger.error("Invalid tag format. Use: key1=value1,key2=value2")
-            return
-    
-    cmd.cleanup_security_groups(vpc_id=vpc_id, tags=parsed_tags)
-
-
-@vpc_command.command()
-def cleanup_route_tables(
-    vpc_id: str = Option(..., "--vpc-id", help="VPC ID"),
-    tags: str = Option(None, "--tags", help="Filter resources by tags (format: key1=value1,key2=value2)")
-):
-    """Clean only route tables in a VPC."""
-    cmd = VPCCommand()
-    cmd.setup_context()
-    
-    parsed_tags = None
-    if tags:
-        try:
-            parsed_tags = dict(tag.split('=') for tag in tags.split(','))
-        except ValueError:
-            logger.error("Invalid tag format. Use: key1=value1,key2=value2")
-            return
-    
-    cmd.cleanup_route_tables(vpc_id=vpc_id, tags=parsed_tags)
 
+def _parse_tags(tags: Optional[str]) -> Optional[Dict[str, str]]:
+    """
+    Parse key1=value1,key2=value2 tag syntax into a dict.
 
-@vpc_command.command()
-def cleanup_network_acls(
-    vpc_id: str = Option(..., "--vpc-id", help="VPC ID"),
-    tags: str = Option(None, "--tags", help="Filter resources by tags (format: key1=value1,key2=value2)")
-):
-    """Clean only network ACLs in a VPC."""
-    cmd = VPCCommand()
-    cmd.setup_context()
-    
-    parsed_tags = None
-    if tags:
-        try:
-            parsed_tags = dict(tag.split('=') for tag in tags.split(','))
-        except ValueError:
-            logger.error("Invalid tag format. Use: key1=value1,key2=value2")
+    Raises:
+        BadParameter: If a tag is missing its '=' separator
+    """
+    if not tags:
+        return None
+    parsed = {}
+    # partition beats split here: one pass per tag, and a malformed entry is
+    # reported by name instead of a generic ValueError from dict()
+    for part in tags.split(','):
+        key, sep, value = part.partition('=')
+        if not sep:
+            raise BadParameter(f"missing '=' in tag '{part}'. Use: key1=value1,key2=value2")
+        parsed[key.strip()] = value.strip()
+    return parsed
+
+
+def _make_handler(description: str, method_name: str):
+    """Build the Typer handler for one cleanup command."""
+
+    def handler(
+        vpc_id: str = Option(..., "--vpc-id", help="VPC ID"),
+        tags: str = Option(None, "--tags", help=_TAGS_HELP)
+    ):
+        if getattr(getattr(VPCCommand, method_name), '_is_stub', False):
+            logger.info(f"{method_name} is not implemented yet")
             return
-    
-    cmd.cleanup_network_acls(vpc_id=vpc_id, tags=parsed_tags)
+        cmd = _get_command()
+        getattr(cmd, method_name)(vpc_id=vpc_id, tags=_parse_tags(tags))
 
+    handler.__doc__ = f"Clean only {description} in a VPC."
+    return handler
 
-@vpc_command.command()
-def cleanup_nat_gateways(
-    vpc_id: str = Option(..., "--vpc-id", help="VPC ID"),
-    tags: str = Option(None, "--tags", help="Filter resources by tags (format: key1=value1,key2=value2)")
-):
-    """Clean only NAT gateways in a VPC."""
-    cmd = VPCCommand()
-    cmd.setup_context()
-    
-    parsed_tags = None
-    if tags:
-        try:
-            parsed_tags = dict(tag.split('=') for tag in tags.split(','))
-        except ValueError:
-            logger.error("Invalid tag format. Use: key1=value1,key2=value2")
-            return
-    
-    cmd.cleanup_nat_gateways(vpc_id=vpc_id, tags=parsed_tags)
 
-
-@vpc_command.command()
-def cleanup_vpc_endpoints(
-    vpc_id: str = Option(..., "--vpc-id", help="VPC ID"),
-    tags: str = Option(None, "--tags", help="Filter resources by tags (format: key1=value1,key2=value2)")
-):
-    """Clean only VPC endpoints in a VPC."""
-    cmd = VPCCommand()
-    cmd.setup_context()
-    
-    parsed_tags = None
-    if tags:
-        try:
-            parsed_tags = dict(tag.split('=') for tag in tags.split(','))
-        except ValueError:
-            logger.error("Invalid tag format. Use: key1=value1,key2=value2")
-            return
-    
-    cmd.cleanup_vpc_endpoints(vpc_id=vpc_id, tags=parsed_tags)
+for _description, _method in CLEANUP_OPS:
+    vpc_command.command(name=_method.replace('_', '-'))(_make_handler(_description, _method))
 
 
 @vpc_command.command()
-def cleanup_network_interfaces(
-    vpc_id: str = Option(..., "--vpc-id", help="VPC ID"),
-    tags: str = Option(None, "--tags", help="Filter resources by tags (format: key1=value1,key2=value2)")
+def bulk_cleanup(
+    vpc_id: str = Option(..., "--vpc-id", help="VPC ID to clean up"),
+    include_vpc: bool = Option(False, "--include-vpc", help="Delete the VPC itself after cleaning resources"),
+    tags: str = Option(None, "--tags", help=_TAGS_HELP)
 ):
-    """Clean only network interfaces in a VPC."""
-    cmd = VPCCommand()
-    cmd.setup_context()
-    
-    parsed_tags = None
-    if tags:
-        try:
-            parsed_tags = dict(tag.split('=') for tag in tags.split(','))
-        except ValueError:
-            logger.error("Invalid tag format. Use: key1=value1,key2=value2")
-            return
-    
-    cmd.cleanup_network_interfaces(vpc_id=vpc_id, tags=parsed_tags)
\ No newline at end of file
+    """Clean all resources in a VPC."""
+    if getattr(VPCCommand.bulk_cleanup, '_is_stub', False):
+        logger.info("bulk_cleanup is not implemented yet")
+        return
+    cmd = _get_command()
+    cmd.bulk_cleanup(vpc_id=vpc_id, include_vpc=include_vpc, tags=_parse_tags(tags))
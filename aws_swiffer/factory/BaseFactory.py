@@ -1,30 +1,56 @@
-from abc import ABC, abstractmethod
-from typing import Type
-import os
+from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 from pathlib import Path
 import csv
 
 from aws_swiffer.factory import IFactory
 from aws_swiffer.resources.IResource import IResource
+from aws_swiffer.utils import get_base_arn
 
 
 class BaseFactory(IFactory, ABC):
 
-    def __init__(self):
-        super().__init__()
-        self.region = os.getenv('AWS_REGION')
-
-    def create_by_file_list(self, file_path: str) -> list[Type[IResource]]:
+    # Factories whose create_by_name performs AWS round-trips set this flag so
+    # create_by_file_list fans the calls out across threads; purely local ARN
+    # builders stay single-threaded and skip the pool overhead.
+    create_by_name_is_remote = False
+
+    # ARN prefix pieces used by _arn_prefix. Subclasses that build ARNs from
+    # plain names set arn_service plus the type segment (e.g. ':repository/')
+    # and, when needed, extra get_base_arn keyword arguments.
+    arn_service = None
+    arn_name_prefix = ''
+    arn_base_kwargs = {}
+
+    def _arn_prefix(self) -> str:
+        """Return the '<base arn><type segment>' prefix, computed once per factory."""
+        prefix = getattr(self, '_arn_prefix_cache', None)
+        if prefix is None:
+            prefix = f"{get_base_arn(self.arn_service, **self.arn_base_kwargs)}{self.arn_name_prefix}"
+            self._arn_prefix_cache = prefix
+        return prefix
+
+    def create_by_file_list(self, file_path: str) -> Iterable[IResource]:
         file_path = Path(file_path)
-        
-        resource_arns: list[Type[IResource]] = []
-
-        with open(file_path, 'r') as f:
-            csv_reader = csv.DictReader(f)
-
-            for row in csv_reader:
-                resource_name = row['resource_names']
-                resource_arn = self.create_by_name(resource_name)
-                resource_arns.append(resource_arn)
 
-        return resource_arns
+        with open(file_path, 'r', newline='') as f:
+            csv_reader = csv.reader(f)
+            header = next(csv_reader, None)
+            if header is None:
+                return
+            # Resolve the column once and read positional rows: csv.reader
+            # skips DictReader's per-row dict construction
+            name_index = header.index('resource_names')
+
+            if not self.create_by_name_is_remote:
+                for row in csv_reader:
+                    if row:
+                        yield self.create_by_name(row[name_index])
+                return
+
+            names = [row[name_index] for row in csv_reader if row]
+
+        # executor.map preserves input order, so results still match the file
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            yield from executor.map(self.create_by_name, names)
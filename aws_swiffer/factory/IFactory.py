@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Type
+from typing import Iterable
 import os
 
 from aws_swiffer.resources.IResource import IResource
@@ -11,15 +11,15 @@ class IFactory(ABC):
         self.region = os.getenv('AWS_REGION')
 
     @abstractmethod
-    def create_by_tags(self, tags: dict) -> list[Type[IResource]]:
+    def create_by_tags(self, tags: dict) -> Iterable[IResource]:
         raise NotImplementedError
 
     @abstractmethod
-    def create_by_arn(self, arn: str) -> Type[IResource]:
+    def create_by_arn(self, arn: str) -> IResource:
         raise NotImplementedError
 
     @abstractmethod
-    def create_by_name(self, name: str) -> Type[IResource]:
+    def create_by_name(self, name: str) -> IResource:
         raise NotImplementedError
 
     @abstractmethod
@@ -27,6 +27,6 @@ class IFactory(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def create_by_file_list(self, file_path: str) -> list[Type[IResource]]:
+    def create_by_file_list(self, file_path: str) -> Iterable[IResource]:
         raise NotImplementedError
 
@@ -1,3 +1,3 @@
 from .IFactory import IFactory
-from .helper import get_resources_by_tags
+from .helper import get_resources_by_tags, batch_get_resources_by_tags
 from .BaseFactory import BaseFactory
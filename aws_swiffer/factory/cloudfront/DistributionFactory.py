@@ -1,20 +1,24 @@
-import os
+
+from typing import Iterable
 
 from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.resources.cloudfront.Distribution import Distribution
 from aws_swiffer.factory import get_resources_by_tags, BaseFactory
-from aws_swiffer.utils import get_logger, get_base_arn, validate_arn
+from aws_swiffer.utils import get_logger, validate_arn
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class DistributionFactory(BaseFactory):
 
+    arn_service = 'cloudfront'
+    arn_name_prefix = ':distribution/'
+
     def __init__(self):
         self.region = "us-east-1"
         super().__init__()
 
-    def create_by_tags(self, tags: dict) -> list[IResource]:
+    def create_by_tags(self, tags: dict) -> Iterable[IResource]:
         try:
             resource_type_filters = 'cloudfront:distribution'
             resources = get_resources_by_tags(tags=tags,
@@ -27,11 +31,11 @@ class DistributionFactory(BaseFactory):
 
     def create_by_arn(self, arn: str) -> IResource:
         validate_arn(arn)
-        name = arn.split('/')[1]
+        name = arn.partition('/')[2]
         return Distribution(name=name, arn=arn)
 
     def create_by_name(self, name: str) -> IResource:
-        arn = f"{get_base_arn('cloudfront', region=self.region)}:distribution/{name}"
+        arn = self._arn_prefix() + name
         return Distribution(name=name, arn=arn)
 
     def create_by_id(self, resource_id: str) -> IResource:
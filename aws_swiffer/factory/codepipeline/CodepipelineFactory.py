@@ -1,16 +1,20 @@
-import os
+
+from typing import Iterable
 
 from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.resources.codepipeline import Codepipeline
 from aws_swiffer.factory import get_resources_by_tags, BaseFactory
-from aws_swiffer.utils import get_logger, validate_arn, get_base_arn
+from aws_swiffer.utils import get_logger, validate_arn
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class CodepipelineFactory(BaseFactory):
 
-    def create_by_tags(self, tags: dict) -> list[IResource]:
+    arn_service = 'codepipeline'
+    arn_name_prefix = ':'
+
+    def create_by_tags(self, tags: dict) -> Iterable[IResource]:
         try:
             resource_type_filters = 'codepipeline:pipeline'
             resources = get_resources_by_tags(tags=tags,
@@ -23,11 +27,11 @@ class CodepipelineFactory(BaseFactory):
 
     def create_by_arn(self, arn: str) -> IResource:
         validate_arn(arn)
-        name = arn.split(':')[-1]
+        name = arn.rpartition(':')[2]
         return Codepipeline(arn=arn, name=name)
 
     def create_by_name(self, name: str) -> IResource:
-        arn = f"{get_base_arn('codepipeline')}:{name}"
+        arn = self._arn_prefix() + name
         return Codepipeline(arn=arn, name=name)
 
     def create_by_id(self, resource_id: str) -> IResource:
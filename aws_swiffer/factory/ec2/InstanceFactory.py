@@ -1,16 +1,20 @@
-import os
+
+from typing import Iterable
 
 from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.factory import get_resources_by_tags, BaseFactory
-from aws_swiffer.utils import get_logger, get_base_arn
+from aws_swiffer.utils import get_logger
 from aws_swiffer.resources import Instance
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class InstanceFactory(BaseFactory):
 
-    def create_by_tags(self, tags: dict) -> list[IResource]:
+    arn_service = 'ec2'
+    arn_name_prefix = ':instance/'
+
+    def create_by_tags(self, tags: dict) -> Iterable[IResource]:
         try:
             resource_type_filters = 'ec2:instance'
             resources = get_resources_by_tags(tags=tags,
@@ -25,14 +29,17 @@ class InstanceFactory(BaseFactory):
         r = Instance(name='', arn=arn)
         return r
 
+    # create_by_name resolves the instance through a tag search round-trip
+    create_by_name_is_remote = True
+
     def create_by_name(self, name: str) -> IResource:
-        resources = self.create_by_tags({'Name': name})
-        if resources:
-            return resources[0]
+        resource = next(iter(self.create_by_tags({'Name': name})), None)
+        if resource:
+            return resource
         else:
             raise Exception(f"Instance not found by name: {name}")
 
     def create_by_id(self, resource_id: str) -> IResource:
-        arn = f"{get_base_arn('ec2', self.region)}:instance/{resource_id}"
+        arn = self._arn_prefix() + resource_id
         r = Instance(name='', arn=arn)
         return r
@@ -1,16 +1,20 @@
-import os
+
+from typing import Iterable
 
 from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.resources.ecr import Ecr
 from aws_swiffer.factory import get_resources_by_tags, BaseFactory
-from aws_swiffer.utils import get_logger, get_base_arn, validate_arn
+from aws_swiffer.utils import get_logger, validate_arn
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class EcrFactory(BaseFactory):
 
-    def create_by_tags(self, tags: dict) -> list[IResource]:
+    arn_service = 'ecr'
+    arn_name_prefix = ':repository/'
+
+    def create_by_tags(self, tags: dict) -> Iterable[IResource]:
         try:
             resource_type_filters = 'ecr:repository'
             resources = get_resources_by_tags(tags=tags,
@@ -23,11 +27,11 @@ class EcrFactory(BaseFactory):
 
     def create_by_arn(self, arn: str) -> IResource:
         validate_arn(arn)
-        name = arn.split('/')[1]
+        name = arn.partition('/')[2]
         return Ecr(name=name, arn=arn)
 
     def create_by_name(self, name: str) -> IResource:
-        arn = f"{get_base_arn('ecr', region=self.region)}:repository/{name}"
+        arn = self._arn_prefix() + name
         return Ecr(name=name, arn=arn)
 
     def create_by_id(self, resource_id: str) -> IResource:
@@ -1,38 +1,112 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from aws_swiffer.utils import get_client
 from aws_swiffer.resources import IResource
-from typing import Union, Type
+from typing import Iterator, Union, Type
+
+# Tag searches are idempotent, so identical queries issued by dependent cleanup
+# stages within one CLI invocation are served from memory. Entries hold plain
+# (arn, tags) pairs, never resource objects, so cache hits cannot leak state
+# between callers. The short TTL keeps results honest for long-running sweeps.
+_CACHE_TTL_SECONDS = 60
+_tag_search_cache = {}
+
+# Maximum ResourcesPerPage accepted by the Resource Groups Tagging API
+_MAX_PAGE_SIZE = 100
+
+
+def _paginate_with_lookahead(client, request: dict) -> Iterator[dict]:
+    """
+    Yield get_resources pages while prefetching the next page in the background.
+
+    The tagging API chains pages through PaginationToken, so pages cannot be
+    fetched in parallel; a one-page lookahead still overlaps each network
+    round-trip with the caller's processing of the previous page.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(client.get_resources, **request)
+        while future is not None:
+            page = future.result()
+            token = page.get('PaginationToken')
+            if token:
+                future = executor.submit(client.get_resources, PaginationToken=token, **request)
+            else:
+                future = None
+            yield page
 
 
 def get_resources_by_tags(tags, resource_type_filters: Union[str, list[str]],
-                          resource_class: Type[IResource], region=None):
-    client = get_client('resourcegroupstaggingapi', region=region)
-    paginator = client.get_paginator('get_resources')
+                          resource_class: Type[IResource], region=None) -> Iterator[IResource]:
+    """
+    Find resources matching tags with a single Resource Groups Tagging API scan.
 
-    resources = []
+    This is the shared entry point for all factory create_by_tags implementations:
+    one paginated get_resources call returns ARNs and tags across the requested
+    resource types, so factories never need per-service list + tag-fetch loops.
 
-    tag_filters = []
+    Resources are yielded page by page, so callers can start removals after the
+    first page instead of holding the whole result set in memory.
+    """
+    client = get_client('resourcegroupstaggingapi', region=region)
 
-    if type(resource_type_filters) is str:
+    if isinstance(resource_type_filters, str):
         resource_type_filters = [resource_type_filters]
-    elif type(resource_type_filters) is list:
-        resource_type_filters = resource_type_filters
-    else:
+    elif not isinstance(resource_type_filters, list):
         raise ValueError('Invalid resource type')
 
-    for k, v in tags.items():
-        if type(v) is str:
-            tag_filters.append({'Key': k, 'Values': [v]})
-        elif type(v) is list:
-            tag_filters.append({'Key': k, 'Values': v})
-        else:
-            raise ValueError('Invalid tag value')
+    if any(not isinstance(v, (str, list)) for v in tags.values()):
+        raise ValueError('Invalid tag value')
+    tag_filters = [{'Key': k, 'Values': v if isinstance(v, list) else [v]}
+                   for k, v in tags.items()]
+
+    cache_key = (tuple((f['Key'], tuple(f['Values'])) for f in tag_filters),
+                 tuple(resource_type_filters), region)
+    cached = _tag_search_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _CACHE_TTL_SECONDS:
+        for arn, resource_tags in cached[1]:
+            yield resource_class(name='', arn=arn, tags=resource_tags)
+        return
+
+    request = {'TagFilters': tag_filters, 'ResourceTypeFilters': resource_type_filters,
+               'ResourcesPerPage': _MAX_PAGE_SIZE}
+
+    found = []
+    # Local binds keep the per-resource loop tight on pages of 100 entries
+    build = resource_class
+    record = found.append
+    for page in _paginate_with_lookahead(client, request):
+        for resource in page['ResourceTagMappingList']:
+            arn = resource['ResourceARN']
+            resource_tags = resource['Tags']
+            record((arn, resource_tags))
+            yield build(name='', arn=arn, tags=resource_tags)
+
+    # Only fully consumed searches are cached, so an abandoned generator can
+    # never install a truncated result set.
+    _tag_search_cache[cache_key] = (time.monotonic(), found)
+
+
+
+class _TaggedArn:
+    """Minimal carrier for one tag-search match, used by the batch helper."""
+    __slots__ = ('arn', 'tags')
+
+    def __init__(self, name: str = '', arn: str = '', tags: list = None):
+        self.arn = arn
+        self.tags = tags
 
-    response_iterator = paginator.paginate(TagFilters=tag_filters, ResourceTypeFilters=resource_type_filters)
 
-    for page in response_iterator:
-        resource_tag_mapping_list = page['ResourceTagMappingList']
-        for resource in resource_tag_mapping_list:
-            r = resource_class(name='', arn=resource['ResourceARN'], tags=resource['Tags'])
-            resources.append(r)
-    return resources
+def batch_get_resources_by_tags(tags, resource_type_filters: list[str], region=None) -> dict:
+    """
+    Run one combined tag search and group the matches by ARN service prefix.
 
+    Callers cleaning several services at once hand the full filter list to a
+    single paginated get_resources scan instead of one scan per factory, then
+    pick their slice from the returned {service: [(arn, tags), ...]} dict.
+    """
+    grouped = {}
+    for match in get_resources_by_tags(tags, resource_type_filters, _TaggedArn, region=region):
+        service = match.arn.split(':')[2]
+        grouped.setdefault(service, []).append((match.arn, match.tags))
+    return grouped
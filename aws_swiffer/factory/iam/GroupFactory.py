@@ -1,26 +1,30 @@
-import os
+
+from typing import Iterable
 
 from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.factory import BaseFactory
-from aws_swiffer.utils import get_logger, get_base_arn
+from aws_swiffer.utils import get_logger
 from aws_swiffer.resources.iam import Group
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class GroupFactory(BaseFactory):
 
-    def create_by_tags(self, tags: dict) -> list[IResource]:
+    arn_service = 'iam'
+    arn_name_prefix = ':group/'
+
+    def create_by_tags(self, tags: dict) -> Iterable[IResource]:
         # Not supported
         raise Exception("Resource not supported")
 
     def create_by_arn(self, arn: str) -> IResource:
-        name = arn.split("/")[-1]
+        name = arn.rpartition('/')[2]
         r = Group(name=name, arn=arn)
         return r
 
     def create_by_name(self, name: str) -> IResource:
-        arn = f"{get_base_arn('iam', region=self.region)}:group/{name}"
+        arn = self._arn_prefix() + name
         r = Group(name=name, arn=arn)
         return r
 
@@ -1,16 +1,21 @@
-import os
+
+from typing import Iterable
 
 from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.factory import BaseFactory, get_resources_by_tags
-from aws_swiffer.utils import get_logger, get_base_arn
+from aws_swiffer.utils import get_logger
 from aws_swiffer.resources.iam import Policy
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class PolicyFactory(BaseFactory):
 
-    def create_by_tags(self, tags: dict) -> list[IResource]:
+    arn_service = 'iam'
+    arn_name_prefix = ':policy/'
+    arn_base_kwargs = {'with_region': False}
+
+    def create_by_tags(self, tags: dict) -> Iterable[IResource]:
         try:
             resource_type_filters = 'iam:policy'
             resources = get_resources_by_tags(tags=tags,
@@ -22,12 +27,12 @@ class PolicyFactory(BaseFactory):
             raise e
 
     def create_by_arn(self, arn: str) -> IResource:
-        name = arn.split("/")[-1]
+        name = arn.rpartition('/')[2]
         r = Policy(name=name, arn=arn)
         return r
 
     def create_by_name(self, name: str) -> IResource:
-        arn = f"{get_base_arn('iam', with_region=False)}:policy/{name}"
+        arn = self._arn_prefix() + name
         r = Policy(name=name, arn=arn)
         return r
 
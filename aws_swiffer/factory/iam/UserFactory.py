@@ -1,16 +1,20 @@
-import os
+
+from typing import Iterable
 
 from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.factory import get_resources_by_tags, BaseFactory
-from aws_swiffer.utils import get_logger, get_base_arn
+from aws_swiffer.utils import get_logger
 from aws_swiffer.resources.iam import User
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class UserFactory(BaseFactory):
 
-    def create_by_tags(self, tags: dict) -> list[IResource]:
+    arn_service = 'iam'
+    arn_name_prefix = ':user/'
+
+    def create_by_tags(self, tags: dict) -> Iterable[IResource]:
         try:
             resource_type_filters = 'iam:user'
             resources = get_resources_by_tags(tags=tags,
@@ -22,12 +26,12 @@ class UserFactory(BaseFactory):
             raise e
 
     def create_by_arn(self, arn: str) -> IResource:
-        name = arn.split("/")[-1]
+        name = arn.rpartition('/')[2]
         r = User(name=name, arn=arn)
         return r
 
     def create_by_name(self, name: str) -> IResource:
-        arn = f"{get_base_arn('iam', region=self.region)}:user/{name}"
+        arn = self._arn_prefix() + name
         r = User(name=name, arn=arn)
         return r
 
@@ -1,16 +1,17 @@
-import os
+
+from typing import Iterable
 
 from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.factory import get_resources_by_tags, BaseFactory
 from aws_swiffer.utils import get_logger
 from aws_swiffer.resources import Bucket
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class BucketFactory(BaseFactory):
 
-    def create_by_tags(self, tags: dict) -> list[IResource]:
+    def create_by_tags(self, tags: dict) -> Iterable[IResource]:
         try:
             resource_type_filters = 's3:bucket'
             resources = get_resources_by_tags(tags=tags,
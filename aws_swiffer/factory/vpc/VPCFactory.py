@@ -1,7 +1,10 @@
 """VPC Factory for creating VPC resource instances."""
 
-import os
-from typing import List, Type, Dict, Any
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import List, Dict, Any, Iterator
 from abc import abstractmethod
 
 from aws_swiffer.factory.BaseFactory import BaseFactory
@@ -10,7 +13,13 @@ from aws_swiffer.resources.vpc.VPCResource import VPCResource
 from aws_swiffer.resources.vpc.SubnetResource import SubnetResource
 from aws_swiffer.utils import get_logger, get_client
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
+
+# Subnet discovery results keyed by (region, vpc_id). A CLI flow can query the
+# same VPC several times (e.g. create_vpc_resources then create_by_resource_type);
+# within the TTL those hit memory instead of repeating DescribeSubnets.
+_SUBNETS_CACHE_TTL_SECONDS = 300
+_subnets_cache = {}
 
 
 class VPCResourceCollection:
@@ -34,21 +43,35 @@ class VPCResourceCollection:
         self.internet_gateways: List[VPCResource] = []
         self.elastic_ips: List[VPCResource] = []
         self.vpc_peering_connections: List[VPCResource] = []
+        # Filter results keyed by the filter arguments; bulk flows apply the
+        # same tag filter to a collection repeatedly and get the cached
+        # sub-collection back instead of re-scanning every list
+        self._filter_cache: Dict[Any, 'VPCResourceCollection'] = {}
+        # Tag pairs already applied server-side (e.g. a Tagging API TagFilters
+        # discovery); filter_by_tags skips the Python pass for subsets of these
+        self.pre_filtered_by = None
+    
+    # Per-type list attributes, in deletion-relevant order; the filter methods
+    # iterate this once instead of repeating a comprehension per attribute
+    _RESOURCE_ATTRS = ('subnets', 'security_groups', 'route_tables', 'network_acls',
+                       'network_interfaces', 'nat_gateways', 'vpc_endpoints',
+                       'internet_gateways', 'elastic_ips', 'vpc_peering_connections')
+    
+    def _filtered(self, predicate) -> 'VPCResourceCollection':
+        """Build a new collection keeping only resources matching the predicate."""
+        filtered = VPCResourceCollection(self.vpc_id)
+        filtered.pre_filtered_by = self.pre_filtered_by
+        for attr in self._RESOURCE_ATTRS:
+            setattr(filtered, attr, [r for r in getattr(self, attr) if predicate(r)])
+        return filtered
     
+    def iter_all_resources(self) -> Iterator[VPCResource]:
+        """Iterate over all resources without building an intermediate list."""
+        return chain.from_iterable(getattr(self, attr) for attr in self._RESOURCE_ATTRS)
+
     def get_all_resources(self) -> List[VPCResource]:
         """Get flat list of all resources."""
-        all_resources = []
-        all_resources.extend(self.subnets)
-        all_resources.extend(self.security_groups)
-        all_resources.extend(self.route_tables)
-        all_resources.extend(self.network_acls)
-        all_resources.extend(self.network_interfaces)
-        all_resources.extend(self.nat_gateways)
-        all_resources.extend(self.vpc_endpoints)
-        all_resources.extend(self.internet_gateways)
-        all_resources.extend(self.elastic_ips)
-        all_resources.extend(self.vpc_peering_connections)
-        return all_resources
+        return list(self.iter_all_resources())
     
     def filter_by_tags(self, tags: Dict[str, str]) -> 'VPCResourceCollection':
         """
@@ -60,29 +83,35 @@ class VPCResourceCollection:
         Returns:
             New VPCResourceCollection with filtered resources
         """
-        filtered = VPCResourceCollection(self.vpc_id)
-        
-        def matches_tags(resource: VPCResource) -> bool:
-            if not resource.tags:
-                return not tags  # If no tags required and resource has no tags, match
-            
-            resource_tag_dict = {tag.get('Key', ''): tag.get('Value', '') 
-                               for tag in resource.tags if isinstance(tag, dict)}
-            
-            return all(resource_tag_dict.get(key) == value 
-                      for key, value in tags.items())
-        
-        filtered.subnets = [r for r in self.subnets if matches_tags(r)]
-        filtered.security_groups = [r for r in self.security_groups if matches_tags(r)]
-        filtered.route_tables = [r for r in self.route_tables if matches_tags(r)]
-        filtered.network_acls = [r for r in self.network_acls if matches_tags(r)]
-        filtered.network_interfaces = [r for r in self.network_interfaces if matches_tags(r)]
-        filtered.nat_gateways = [r for r in self.nat_gateways if matches_tags(r)]
-        filtered.vpc_endpoints = [r for r in self.vpc_endpoints if matches_tags(r)]
-        filtered.internet_gateways = [r for r in self.internet_gateways if matches_tags(r)]
-        filtered.elastic_ips = [r for r in self.elastic_ips if matches_tags(r)]
-        filtered.vpc_peering_connections = [r for r in self.vpc_peering_connections if matches_tags(r)]
-        
+        requested = frozenset(tags.items())
+        if self.pre_filtered_by is not None and requested <= self.pre_filtered_by:
+            # These predicates were already pushed to the server during
+            # discovery, so every resource in the collection matches
+            return self
+
+        key = ('tags', requested)
+        cached = self._filter_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # The predicate is specialized once for this call's tag pairs; the
+        # default arg binds them as a local inside the per-resource hot loop
+        items = tuple(tags.items())
+        if not items:
+            def matches_tags(resource: VPCResource) -> bool:
+                return True  # an empty filter matches every resource, tagged or not
+        else:
+            def matches_tags(resource: VPCResource, _items=items) -> bool:
+                if not resource.tags:
+                    return False
+
+                # tag_dict is precomputed at resource construction
+                tag_dict = resource.tag_dict
+                return all(tag_dict.get(key) == value for key, value in _items)
+
+        filtered = self._filtered(matches_tags)
+        filtered.pre_filtered_by = (self.pre_filtered_by or frozenset()) | requested
+        self._filter_cache[key] = filtered
         return filtered
     
     def exclude_default_resources(self) -> 'VPCResourceCollection':
@@ -92,20 +121,12 @@ class VPCResourceCollection:
         Returns:
             New VPCResourceCollection with default resources excluded
         """
-        filtered = VPCResourceCollection(self.vpc_id)
-        
-        filtered.subnets = [r for r in self.subnets if not r.is_default_resource()]
-        filtered.security_groups = [r for r in self.security_groups if not r.is_default_resource()]
-        filtered.route_tables = [r for r in self.route_tables if not r.is_default_resource()]
-        filtered.network_acls = [r for r in self.network_acls if not r.is_default_resource()]
-        filtered.network_interfaces = [r for r in self.network_interfaces if not r.is_default_resource()]
-        filtered.nat_gateways = [r for r in self.nat_gateways if not r.is_default_resource()]
-        filtered.vpc_endpoints = [r for r in self.vpc_endpoints if not r.is_default_resource()]
-        filtered.internet_gateways = [r for r in self.internet_gateways if not r.is_default_resource()]
-        filtered.elastic_ips = [r for r in self.elastic_ips if not r.is_default_resource()]
-        filtered.vpc_peering_connections = [r for r in self.vpc_peering_connections if not r.is_default_resource()]
-        
-        return filtered
+        key = 'exclude_default'
+        cached = self._filter_cache.get(key)
+        if cached is None:
+            cached = self._filtered(lambda r: not r.is_default_resource())
+            self._filter_cache[key] = cached
+        return cached
 
 
 class VPCFactory(BaseFactory):
@@ -116,6 +137,20 @@ class VPCFactory(BaseFactory):
         super().__init__()
         self.ec2_client = get_client('ec2', self.region)
     
+    @classmethod
+    def invalidate_subnets_cache(cls, vpc_id: str = None) -> None:
+        """
+        Drop cached subnet discoveries.
+        
+        Args:
+            vpc_id: Clear only this VPC's entries, or everything when omitted
+        """
+        if vpc_id is None:
+            _subnets_cache.clear()
+        else:
+            for key in [k for k in _subnets_cache if k[1] == vpc_id]:
+                del _subnets_cache[key]
+    
     def create_vpc_resources(self, vpc_id: str) -> VPCResourceCollection:
         """
         Discover and create all resources in a VPC.
@@ -129,11 +164,20 @@ class VPCFactory(BaseFactory):
         logger.info(f"Discovering resources in VPC: {vpc_id}")
         collection = VPCResourceCollection(vpc_id)
         
-        # Discover subnets
-        collection.subnets = self._discover_subnets(vpc_id)
-        
+        # Each discovery is an independent describe round-trip, so they run
+        # concurrently; register new _discover_* methods here as they land and
+        # total wall time stays close to the slowest describe instead of the sum.
         # TODO: Implement discovery for other resource types
-        # This will be implemented in subsequent tasks
+        discoveries = {
+            'subnets': self._discover_subnets,
+        }
+        
+        with ThreadPoolExecutor(max_workers=len(discoveries)) as executor:
+            futures = {attr: executor.submit(discover, vpc_id)
+                       for attr, discover in discoveries.items()}
+            for attr, future in futures.items():
+                setattr(collection, attr, future.result())
+        
         logger.info(f"Discovered {len(collection.subnets)} subnets in VPC {vpc_id}")
         
         return collection
@@ -167,7 +211,7 @@ class VPCFactory(BaseFactory):
         return type_mapping.get(resource_type, [])
     
     # Implement IFactory interface methods
-    def create_by_tags(self, tags: dict) -> List[Type[IResource]]:
+    def create_by_tags(self, tags: dict) -> List[IResource]:
         """
         Create resources by tags.
         
@@ -181,7 +225,7 @@ class VPCFactory(BaseFactory):
         logger.info(f"Creating VPC resources by tags: {tags}")
         return []
     
-    def create_by_arn(self, arn: str) -> Type[IResource]:
+    def create_by_arn(self, arn: str) -> IResource:
         """
         Create resource by ARN.
         
@@ -195,7 +239,7 @@ class VPCFactory(BaseFactory):
         logger.info(f"Creating VPC resource by ARN: {arn}")
         raise NotImplementedError("ARN-based resource creation not yet implemented")
     
-    def create_by_name(self, name: str) -> Type[IResource]:
+    def create_by_name(self, name: str) -> IResource:
         """
         Create resource by name.
         
@@ -233,47 +277,117 @@ class VPCFactory(BaseFactory):
         Returns:
             List of SubnetResource instances
         """
+        key = (self.region, vpc_id)
+        entry = _subnets_cache.get(key)
+        if entry and time.monotonic() - entry[0] < _SUBNETS_CACHE_TTL_SECONDS:
+            logger.debug(f"Using cached subnets for VPC: {vpc_id}")
+            return entry[1]
+        
         logger.debug(f"Discovering subnets in VPC: {vpc_id}")
         subnets = []
         
         try:
-            response = self.ec2_client.describe_subnets(
+            # Paginated so accounts with >100 subnets per VPC are not truncated;
+            # the builder is bound once so the per-subnet loop works on locals
+            build = self._build_subnet_resource
+            paginator = self.ec2_client.get_paginator('describe_subnets')
+            pages = paginator.paginate(
                 Filters=[
                     {'Name': 'vpc-id', 'Values': [vpc_id]}
-                ]
+                ],
+                PaginationConfig={'PageSize': 100}
             )
-            
-            for subnet_data in response['Subnets']:
-                subnet_id = subnet_data['SubnetId']
-                availability_zone = subnet_data['AvailabilityZone']
-                cidr_block = subnet_data['CidrBlock']
-                tags = subnet_data.get('Tags', [])
-                
-                # Extract name from tags
-                name = subnet_id  # Default to subnet ID
-                for tag in tags:
-                    if tag.get('Key', '').lower() == 'name':
-                        name = tag.get('Value', subnet_id)
-                        break
-                
-                # Construct ARN
-                arn = f"arn:aws:ec2:{self.region}:{subnet_data.get('OwnerId', '')}:subnet/{subnet_id}"
-                
-                subnet_resource = SubnetResource(
-                    arn=arn,
-                    name=name,
-                    vpc_id=vpc_id,
-                    subnet_id=subnet_id,
-                    availability_zone=availability_zone,
-                    cidr_block=cidr_block,
-                    tags=tags,
-                    region=self.region
-                )
-                
-                subnets.append(subnet_resource)
-                logger.debug(f"Discovered subnet: {subnet_id} ({name}) in {availability_zone}")
+
+            for page in pages:
+                subnets.extend(build(vpc_id, subnet_data) for subnet_data in page['Subnets'])
         
         except Exception as e:
             logger.error(f"Error discovering subnets in VPC {vpc_id}: {e}")
+            return subnets
+        
+        _subnets_cache[key] = (time.monotonic(), subnets)
+        return subnets
+    
+    def _discover_subnets_batch(self, vpc_ids: List[str]) -> Dict[str, List[SubnetResource]]:
+        """
+        Discover subnets for many VPCs with one DescribeSubnets call.
+        
+        The vpc-id filter accepts multiple values, so bulk flows issue a single
+        request instead of one per VPC and results are demuxed by VpcId here.
+        Each VPC's slice also lands in the subnet cache for later single-VPC
+        lookups.
+        
+        Args:
+            vpc_ids: VPC IDs to discover subnets for
+            
+        Returns:
+            Mapping of VPC ID to its SubnetResource list
+        """
+        grouped: Dict[str, List[SubnetResource]] = {vpc_id: [] for vpc_id in vpc_ids}
+        if not vpc_ids:
+            return grouped
+        
+        logger.debug(f"Discovering subnets in {len(vpc_ids)} VPCs")
+        try:
+            paginator = self.ec2_client.get_paginator('describe_subnets')
+            pages = paginator.paginate(
+                Filters=[
+                    {'Name': 'vpc-id', 'Values': list(vpc_ids)}
+                ],
+                PaginationConfig={'PageSize': 100}
+            )
+            
+            build = self._build_subnet_resource
+            for page in pages:
+                for subnet_data in page['Subnets']:
+                    vpc_id = subnet_data['VpcId']
+                    grouped.setdefault(vpc_id, []).append(build(vpc_id, subnet_data))
+        except Exception as e:
+            logger.error(f"Error discovering subnets in VPCs {vpc_ids}: {e}")
+            return grouped
+        
+        now = time.monotonic()
+        for vpc_id, subnets in grouped.items():
+            _subnets_cache[(self.region, vpc_id)] = (now, subnets)
+        
+        return grouped
+    
+    def _build_subnet_resource(self, vpc_id: str, subnet_data: Dict[str, Any]) -> SubnetResource:
+        """
+        Build a SubnetResource from one DescribeSubnets entry.
+        
+        Args:
+            vpc_id: VPC the subnet belongs to
+            subnet_data: Subnet dict as returned by DescribeSubnets
+            
+        Returns:
+            SubnetResource instance
+        """
+        subnet_id = subnet_data['SubnetId']
+        availability_zone = subnet_data['AvailabilityZone']
+        tags = subnet_data.get('Tags', [])
+
+        # Tag keys are case-sensitive in AWS, so two direct lookups replace the
+        # linear scan that lowercased every key; SubnetResource builds its own
+        # tag dict once in its constructor for later filtering
+        tag_dict = {tag['Key']: tag['Value'] for tag in tags
+                    if isinstance(tag, dict) and 'Key' in tag}
+        name = tag_dict.get('Name') or tag_dict.get('name') or subnet_id
+        
+        # Construct ARN
+        arn = f"arn:aws:ec2:{self.region}:{subnet_data.get('OwnerId', '')}:subnet/{subnet_id}"
         
-        return subnets
\ No newline at end of file
+        # Guarded so large VPCs do not pay f-string formatting per subnet when
+        # debug logging is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Discovered subnet: {subnet_id} ({name}) in {availability_zone}")
+        return SubnetResource(
+            arn=arn,
+            name=name,
+            vpc_id=vpc_id,
+            subnet_id=subnet_id,
+            availability_zone=availability_zone,
+            cidr_block=subnet_data['CidrBlock'],
+            tags=tags,
+            region=self.region
+        )
\ No newline at end of file
@@ -1,12 +1,54 @@
+import importlib
+
 from typer import Typer, Option
+from typer.core import TyperGroup
+from typer.main import get_group
 
-from aws_swiffer.command import s3_command, codebuild_command, codepipeline_command, ec2_command, ecr_command, \
-    ecs_command, iam_command, cloudfront_command
-from aws_swiffer.command.dynamodb import dynamodb_command
 from aws_swiffer.utils import get_logger, callback_base
 
 logger = get_logger("MAIN")
 
+# Sub-apps are imported the first time their name is dispatched: loading every
+# command module up front builds all the factories and parses botocore models
+# for services the invocation never touches, which dominates CLI cold start.
+SUBCOMMANDS = {
+    'codebuild': 'aws_swiffer.command.codebuild:codebuild_command',
+    'codepipeline': 'aws_swiffer.command.codepipeline:codepipeline_command',
+    'ec2': 'aws_swiffer.command.ec2:ec2_command',
+    'ecr': 'aws_swiffer.command.ecr:ecr_command',
+    'ecs': 'aws_swiffer.command.ecs:ecs_command',
+    'iam': 'aws_swiffer.command.iam:iam_command',
+    's3': 'aws_swiffer.command.s3:s3_command',
+    'dynamodb': 'aws_swiffer.command.dynamodb:dynamodb_command',
+    'cloudfront': 'aws_swiffer.command.cloudfront:cloudfront_command',
+    'multi': 'aws_swiffer.command.multi:multi_command',
+}
+
+
+class LazyGroup(TyperGroup):
+    """Click group that imports each sub-app only when its name is dispatched."""
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(SUBCOMMANDS))
+
+    def get_command(self, ctx, name):
+        spec = SUBCOMMANDS.get(name)
+        if spec is None:
+            return super().get_command(ctx, name)
+
+        cache = getattr(self, '_lazy_subcommands', None)
+        if cache is None:
+            cache = self._lazy_subcommands = {}
+        group = cache.get(name)
+        if group is None:
+            module_name, _, attr = spec.partition(':')
+            sub_app = getattr(importlib.import_module(module_name), attr)
+            group = get_group(sub_app)
+            group.name = name
+            group.no_args_is_help = True
+            cache[name] = group
+        return group
+
 
 def main_callback(
     profile: str = None,
@@ -19,19 +61,7 @@ def main_callback(
     callback_base(profile, region, skip_account_check, dry_run, auto_approve)
 
 
-app = Typer(no_args_is_help=True, callback=main_callback)
-
-# Add commands here
-app.add_typer(codebuild_command, name="codebuild", no_args_is_help=True)
-app.add_typer(codepipeline_command, name="codepipeline", no_args_is_help=True)
-app.add_typer(ec2_command, name="ec2", no_args_is_help=True)
-app.add_typer(ecr_command, name="ecr", no_args_is_help=True)
-app.add_typer(ecs_command, name="ecs", no_args_is_help=True)
-app.add_typer(iam_command, name="iam", no_args_is_help=True)
-app.add_typer(s3_command, name="s3", no_args_is_help=True)
-app.add_typer(dynamodb_command, name="dynamodb", no_args_is_help=True)
-app.add_typer(dynamodb_command, name="dynamodb", no_args_is_help=True)
-app.add_typer(cloudfront_command, name="cloudfront", no_args_is_help=True)
+app = Typer(no_args_is_help=True, callback=main_callback, cls=LazyGroup)
 
 if __name__ == "__main__":
     app()
@@ -1,19 +1,25 @@
 import abc
-import os
 from typing import TYPE_CHECKING
 
+from aws_swiffer.utils.region import current_region
+
 if TYPE_CHECKING:
     from aws_swiffer.utils.context import ExecutionContext
 
 
 class IResource(abc.ABC):
+    __slots__ = ('arn', 'name', 'tags', 'region')
+
     def __init__(self, arn: str, name: str, tags: list = None, region: str = None):
         if not arn and not name:
             raise Exception("Resource name or ARN is required")
         self.arn = arn
-        self.name = name if name else arn.split('/')[-1]
+        # rsplit with maxsplit only looks at the last segment instead of
+        # splitting the whole ARN; the region split stops after field 3 and
+        # only runs when neither the environment nor the caller supplied one
+        self.name = name or arn.rsplit('/', 1)[-1]
         self.tags = tags
-        self.region = os.getenv('AWS_REGION', region) or arn.split(':')[3]
+        self.region = current_region(region) or arn.split(':', 4)[3]
 
     def __str__(self):
         return f'{self.arn}'
@@ -1,4 +1,3 @@
-import os
 from typing import TYPE_CHECKING
 
 from botocore.exceptions import ClientError
@@ -9,10 +8,11 @@ from aws_swiffer.utils import get_client, get_logger
 if TYPE_CHECKING:
     from aws_swiffer.utils.context import ExecutionContext
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class Distribution(IResource):
+    __slots__ = ('id',)
 
     def __init__(self, arn: str, name: str = None, tags: list = None, region: str = "us-east-1"):
         """
@@ -26,23 +26,40 @@ class Distribution(IResource):
     def remove(self, context: 'ExecutionContext' = None):
         prefix = context.log_prefix() if context else ""
         logger.info(f"{prefix}Trying to delete resource: {self.arn}")
+
+        if not self._should_proceed(context, "delete distribution"):
+            logger.info("Delete skipped")
+            return
+
+        if context and context.dry_run:
+            logger.info(f"{prefix}Would delete distribution: {self.id}")
+            return
+
         client = get_client('cloudfront', self.region)
 
-        etag = self.clean()
-        if etag:
-            response = client.delete_distribution(
-                Id=self.id,
-                IfMatch=etag
-            )
-        else:
-            logger.info(f"{prefix}Cannot disable and delte distribution")
+        etag = self.clean(context)
+        if not etag:
+            logger.info(f"{prefix}Cannot disable and delete distribution")
+            return
+        response = client.delete_distribution(
+            Id=self.id,
+            IfMatch=etag
+        )
         logger.info(f"{prefix}Resource deleted: {self.arn}")
         logger.debug(response)
 
-    def clean(self, context: 'ExecutionContext' = None):
+    def disable_only(self, context: 'ExecutionContext' = None):
+        """
+        Request the distribution be disabled without waiting for deployment.
+
+        Bulk teardown calls this for every distribution first, then waits for
+        all of them at once, so total wall time is the slowest deployment
+        instead of the sum.
+
+        Returns the current ETag, or None on failure.
+        """
         client = get_client('cloudfront', self.region)
         prefix = context.log_prefix() if context else ""
-        etag = None
 
         try:
             response = client.get_distribution_config(Id=self.id)
@@ -60,23 +77,66 @@ class Distribution(IResource):
                 DistributionConfig=config,
                 IfMatch=etag  # Mandatory for updates
             )
+            logger.info(f"{prefix}Disable requested for distribution: {self.id}")
+            return etag
+        except ClientError as e:
+            logger.error(f"Error: {e.response['Error']['Message']}")
+            return None
 
-            waiter = client.get_waiter('distribution_deployed')
-            waiter.wait(
-                Id=self.id,
-                WaiterConfig={
-                    'Delay': 20,      # Check every 20 seconds (faster than default)
-                    'MaxAttempts': 50 # Total attempts before failing
-                }
-            )
+    def wait_deployed(self, delay: int = 5, max_attempts: int = 120):
+        """Block until the distribution reports Deployed.
+
+        The short poll interval returns in seconds when CloudFront is quick,
+        instead of the waiter default that rounds every wait up to 20s steps.
+        """
+        client = get_client('cloudfront', self.region)
+        waiter = client.get_waiter('distribution_deployed')
+        waiter.wait(
+            Id=self.id,
+            WaiterConfig={
+                'Delay': delay,
+                'MaxAttempts': max_attempts
+            }
+        )
+
+    def clean(self, context: 'ExecutionContext' = None):
+        client = get_client('cloudfront', self.region)
+        prefix = context.log_prefix() if context else ""
 
+        etag = self.disable_only(context)
+        if etag is None:
+            return None
+
+        try:
+            self.wait_deployed()
             logger.info(f"{prefix}Successfully disabled distribution: {self.id}")
 
             # Get new ETag after disabling distribution
             after_disable_response = client.get_distribution_config(Id=self.id)
             etag = after_disable_response['ETag']
-
         except ClientError as e:
             logger.error(f"Error: {e.response['Error']['Message']}")
 
-        return etag
\ No newline at end of file
+        return etag
+
+
+def wait_all_deployed(distributions, delay: int = 5, max_attempts: int = 120):
+    """
+    Wait for many distributions to report Deployed, polling them concurrently.
+
+    Pair with disable_only: kick off every disable first, then one call here
+    multiplexes the waits in a thread pool.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    distributions = list(distributions)
+    if not distributions:
+        return
+    with ThreadPoolExecutor(max_workers=min(16, len(distributions))) as executor:
+        futures = {executor.submit(distribution.wait_deployed, delay, max_attempts): distribution
+                   for distribution in distributions}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error waiting for distribution {futures[future].id}: {e}")
\ No newline at end of file
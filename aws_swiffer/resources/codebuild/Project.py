@@ -1,16 +1,19 @@
-import os
+from typing import TYPE_CHECKING
 
 import botocore.exceptions
-import botocore.errorfactory
 
 from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.utils import get_client
 from aws_swiffer.utils import get_logger
 
-logger = get_logger(os.path.basename(__file__))
+if TYPE_CHECKING:
+    from aws_swiffer.utils.context import ExecutionContext
+
+logger = get_logger(__name__)
 
 
 class Project(IResource):
+    __slots__ = ()
 
     def __init__(self, arn: str, name: str = None, tags: list = None, region: str = None):
         # arn:aws:codebuild:eu-west-1:333:project/usbim-meet-fe-dev
@@ -18,15 +21,25 @@ class Project(IResource):
             name = arn.split('/')[-1]
         super().__init__(arn, name, tags, region)
 
-    def remove(self):
+    def remove(self, context: 'ExecutionContext' = None):
+        prefix = context.log_prefix() if context else ""
         client = get_client('codebuild', self.region)
-        logger.info(f"Trying to delete resource: {self.arn}")
+        logger.info(f"{prefix}Trying to delete resource: {self.arn}")
+
+        if not self._should_proceed(context, "delete CodeBuild project"):
+            logger.info("Delete skipped")
+            return
+
+        if context and context.dry_run:
+            logger.info(f"{prefix}Would delete CodeBuild project: {self.name}")
+            return
+
         try:
             response = client.delete_project(
                 name=self.name,
             )
             logger.debug(response)
-            logger.info(f"Resource deleted: {self.arn}")
+            logger.info(f"{prefix}Resource deleted: {self.arn}")
         except botocore.exceptions.ClientError as e:
             logger.error(f"Cannot delete resource: {self.arn}")
             logger.debug(e)
@@ -1,15 +1,19 @@
-import os
+
+from typing import TYPE_CHECKING
 
 import botocore.exceptions
-import botocore.errorfactory
 from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.utils import get_client, get_resource
 from aws_swiffer.utils import get_logger
 
-logger = get_logger(os.path.basename(__file__))
+if TYPE_CHECKING:
+    from aws_swiffer.utils.context import ExecutionContext
+
+logger = get_logger(__name__)
 
 
 class Table(IResource):
+    __slots__ = ()
 
     def __init__(self, arn: str, name: str = None, tags: list = None, region: str = None):
         # arn:aws:dynamodb:eu-west-1:389003593287:table/aes-demo-dynamo-db
@@ -17,36 +21,80 @@ class Table(IResource):
             name = arn.split('/')[-1]
         super().__init__(arn, name, tags, region)
 
-    def remove(self):
+    def remove(self, context: 'ExecutionContext' = None):
+        prefix = context.log_prefix() if context else ""
+        logger.info(f"{prefix}Trying to delete resource: {self.arn}")
+
+        if context and context.dry_run:
+            logger.info(f"{prefix}Would delete table: {self.name}")
+            return
+
         client = get_client('dynamodb', self.region)
-        logger.info(f"Trying to delete resource: {self.arn}")
         try:
             response = client.delete_table(
                 TableName=self.name,
             )
             logger.debug(response)
-            logger.info(f"Resource deleted: {self.arn}")
+            logger.info(f"{prefix}Resource deleted: {self.arn}")
         except botocore.exceptions.ClientError as e:
             logger.error(f"Cannot delete resource: {self.arn}")
             logger.debug(e)
 
     def clean(self):
 
-        """Deletes all items from a DynamoDB table."""
-        dynamodb = get_resource("dynamodb")
+        """Deletes all items from a DynamoDB table with a parallel segment scan."""
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        client = get_client('dynamodb', self.region)
+        dynamodb = get_resource("dynamodb", self.region)
         table = dynamodb.Table(self.name)
 
-        logger.info(f"Trying to delete resource: {self.arn}")
+        logger.info(f"Trying to clean resource: {self.arn}")
+
+        # Key schema is walked once up front; scanned items already contain
+        # only these attributes, so no per-item key extraction is needed
+        key_names = tuple(k['AttributeName'] for k in table.key_schema)
+        # Alias key names in the projection so reserved words do not break the scan
+        projection = ', '.join(f'#k{i}' for i in range(len(key_names)))
+        expression_names = {f'#k{i}': name for i, name in enumerate(key_names)}
+        total_segments = 8
 
-        # Scan the table to get all items
-        response = table.scan()
-        items = response.get("Items", [])
+        def delete_batch(keys):
+            # BatchWriteItem accepts up to 25 delete requests; retry unprocessed ones
+            request = {self.name: [{'DeleteRequest': {'Key': key}} for key in keys]}
+            while request:
+                response = client.batch_write_item(RequestItems=request)
+                request = response.get('UnprocessedItems') or None
+            return len(keys)
 
-        with table.batch_writer() as batch:
-            for item in items:
-                batch.delete_item(Key={k['AttributeName']: item[k['AttributeName']] for k in table.key_schema})
+        def clean_segment(segment):
+            # Each worker scans a disjoint slice of the table (Segment /
+            # TotalSegments), so reading parallelizes along with the deletes
+            # instead of one reader feeding every writer
+            deleted = 0
+            batch = []
+            paginator = client.get_paginator('scan')
+            for page in paginator.paginate(TableName=self.name, ProjectionExpression=projection,
+                                           ExpressionAttributeNames=expression_names,
+                                           Segment=segment, TotalSegments=total_segments,
+                                           PaginationConfig={'PageSize': 1000}):
+                for item in page.get('Items', []):
+                    batch.append(item)
+                    if len(batch) == 25:
+                        deleted += delete_batch(batch)
+                        batch = []
+            if batch:
+                deleted += delete_batch(batch)
+            return deleted
 
-        print(f"Deleted {len(items)} items from {self.name}.")
+        deleted = 0
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            futures = [executor.submit(clean_segment, segment) for segment in range(total_segments)]
+            for future in as_completed(futures):
+                try:
+                    deleted += future.result()
+                except botocore.exceptions.ClientError as e:
+                    logger.error(f"Cannot delete items from {self.name}")
+                    logger.debug(e)
 
-        # Example usage:
-        # clean_dynamodb_table("your_table_name")
+        logger.info(f"Deleted {deleted} items from {self.name}")
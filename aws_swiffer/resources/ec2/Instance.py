@@ -1,4 +1,3 @@
-import os
 from typing import TYPE_CHECKING
 
 import botocore.exceptions
@@ -9,20 +8,26 @@ from aws_swiffer.utils import get_client, get_logger
 if TYPE_CHECKING:
     from aws_swiffer.utils.context import ExecutionContext
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class Instance(IResource):
     # arn:aws:ec2:{Region}:{Account}:instance/{InstanceId}
+    __slots__ = ('instance_id', '_instance_desc')
+
     def __init__(self, arn: str, name: str, tags: list = None, region: str = None):
+        # Describe result from construction, reused by remove() so each
+        # instance costs one DescribeInstances round-trip instead of two
+        self._instance_desc = None
         if not name:
             ec2 = get_client('ec2')
             if arn:
                 self.instance_id = arn.split("/")[1]
                 instance = ec2.describe_instances(InstanceIds=[self.instance_id])['Reservations'][0]['Instances'][0]
+                self._instance_desc = instance
                 tags = instance['Tags']
-                name_list = list(filter(lambda x: x['Key'].lower() == 'name', instance['Tags']))
-                self.name = name_list[0] if name_list else None
+                # Stops at the first hit instead of materializing every match
+                self.name = next((tag for tag in tags if tag['Key'].lower() == 'name'), None)
             else:
                 raise Exception('ARN is required')
         region = region or arn.split(':')[3]
@@ -31,31 +36,117 @@ class Instance(IResource):
     def __str__(self):
         return f'{self.arn}'
 
+    @staticmethod
+    def terminate_by_ids(instance_ids: list, region: str = None, context: 'ExecutionContext' = None):
+        """
+        Terminate many instances at once, one TerminateInstances call per 1000 IDs.
+
+        Args:
+            instance_ids: Instance IDs to terminate
+            region: AWS region
+            context: Optional ExecutionContext for dry-run mode
+        """
+        prefix = context.log_prefix() if context else ""
+        ec2 = get_client('ec2', region)
+        logger.info(f"{prefix}Trying to terminate {len(instance_ids)} instances")
+
+        if context and context.dry_run:
+            logger.info(f"{prefix}Would terminate instances: {' '.join(instance_ids)}")
+            return
+
+        # TerminateInstances accepts up to 1000 instance IDs per call
+        for i in range(0, len(instance_ids), 1000):
+            chunk = instance_ids[i:i + 1000]
+            try:
+                response = ec2.terminate_instances(InstanceIds=chunk)
+                logger.debug(response)
+            except botocore.exceptions.ClientError as e:
+                logger.error(f"Cannot terminate instances: {' '.join(chunk)}")
+                logger.debug(e)
+        logger.info(f"{prefix}Termination requested for {len(instance_ids)} instances")
+
+    @staticmethod
+    def describe_by_ids(instance_ids: list, region: str = None) -> dict:
+        """
+        Describe many instances, one DescribeInstances call per 1000 IDs.
+
+        Args:
+            instance_ids: Instance IDs to describe
+            region: AWS region
+
+        Returns:
+            Mapping of instance ID to its DescribeInstances entry
+        """
+        ec2 = get_client('ec2', region)
+        described = {}
+        # DescribeInstances accepts up to 1000 instance IDs per call
+        for i in range(0, len(instance_ids), 1000):
+            chunk = instance_ids[i:i + 1000]
+            try:
+                response = ec2.describe_instances(InstanceIds=chunk)
+            except botocore.exceptions.ClientError as e:
+                logger.error(f"Cannot describe instances: {' '.join(chunk)}")
+                logger.debug(e)
+                continue
+            for reservation in response['Reservations']:
+                for instance in reservation['Instances']:
+                    described[instance['InstanceId']] = instance
+        return described
+
+    @classmethod
+    def remove_many(cls, instance_ids: list, region: str = None, context: 'ExecutionContext' = None):
+        """
+        Batched equivalent of calling remove() per instance.
+
+        One describe round produces the delete-on-termination volume warnings
+        for every instance, then terminate_by_ids coalesces the terminations,
+        so N removals cost two API rounds per 1000 IDs instead of 2N calls.
+
+        Args:
+            instance_ids: Instance IDs to terminate
+            region: AWS region
+            context: Optional ExecutionContext for dry-run mode
+        """
+        prefix = context.log_prefix() if context else ""
+        described = cls.describe_by_ids(instance_ids, region)
+        for instance_id, instance in described.items():
+            for volume in instance.get('BlockDeviceMappings', []):
+                ebs = volume.get('Ebs', {})
+                if ebs.get('DeleteOnTermination'):
+                    logger.info(f"{prefix}The volume {ebs['VolumeId']} will delete on termination "
+                                f"of {instance_id}")
+        cls.terminate_by_ids(list(instance_ids), region=region, context=context)
+
     def remove(self, context: 'ExecutionContext' = None):
         prefix = context.log_prefix() if context else ""
         logger.info(f"{prefix}Trying to delete resource: {self.arn}")
+
+        # Dry runs short-circuit before the describe round-trip: the preview
+        # does not need the volume listing
+        if context and context.dry_run:
+            logger.info(f"{prefix}Would terminate instance: {self.instance_id}")
+            return
+
         ec2 = get_client('ec2', self.region)
-        volumes_str = ''
+        volume_ids = []
         try:
-            instance = ec2.describe_instances(InstanceIds=[self.instance_id])['Reservations'][0]['Instances'][0]
+            instance = self._instance_desc
+            if instance is None:
+                instance = ec2.describe_instances(InstanceIds=[self.instance_id])['Reservations'][0]['Instances'][0]
             for volume in instance['BlockDeviceMappings']:
                 if volume['Ebs']['DeleteOnTermination']:
                     volume_id = volume['Ebs']['VolumeId']
                     logger.info(f"{prefix}The volume {volume_id} will delete on instance termination")
-                    volumes_str += f"{volume_id} "
-            
+                    volume_ids.append(volume_id)
+
             operation_desc = f"terminate instance {self.instance_id}"
-            if volumes_str:
-                operation_desc += f" and volumes: {volumes_str}"
+            if volume_ids:
+                operation_desc += f" and volumes: {' '.join(volume_ids)} "
             
             if not self._should_proceed(context, operation_desc):
                 logger.info("Termination skipped")
                 return
-            
-            if context and context.dry_run:
-                logger.info(f"{prefix}Would terminate instance: {self.instance_id}")
-                return
-            
+
             response = ec2.terminate_instances(InstanceIds=[self.instance_id])
             logger.info(f"{prefix}Resource deleted: {self.arn}")
             logger.debug(response)
@@ -1,4 +1,4 @@
-import os
+from typing import TYPE_CHECKING
 
 import botocore.exceptions
 
@@ -6,22 +6,35 @@ from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.utils import get_client
 from aws_swiffer.utils import get_logger
 
-logger = get_logger(os.path.basename(__file__))
+if TYPE_CHECKING:
+    from aws_swiffer.utils.context import ExecutionContext
+
+logger = get_logger(__name__)
 
 
 class Ecr(IResource):
+    __slots__ = ()
 
-    def remove(self):
+    def remove(self, context: 'ExecutionContext' = None):
+        prefix = context.log_prefix() if context else ""
         client = get_client('ecr', self.region)
-        logger.info(f"Trying to delete resource: {self.arn}")
+        logger.info(f"{prefix}Trying to delete resource: {self.arn}")
+
+        if not self._should_proceed(context, "delete ECR repository"):
+            logger.info("Delete skipped")
+            return
+
+        if context and context.dry_run:
+            logger.info(f"{prefix}Would delete ECR repository: {self.name}")
+            return
+
         try:
             response = client.delete_repository(
                 repositoryName=self.name,
                 force=True
             )
             logger.debug(response)
-            logger.info(f"Resource deleted: {self.arn}")
+            logger.info(f"{prefix}Resource deleted: {self.arn}")
         except botocore.exceptions.ClientError as e:
             logger.error(f"Cannot delete resource: {self.arn}")
             logger.debug(e)
-
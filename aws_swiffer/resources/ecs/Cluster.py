@@ -1,16 +1,20 @@
-import os
+
+from typing import TYPE_CHECKING
 
 import botocore.exceptions
-import botocore.errorfactory
 
 from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.utils import get_client
 from aws_swiffer.utils import get_logger
 
-logger = get_logger(os.path.basename(__file__))
+if TYPE_CHECKING:
+    from aws_swiffer.utils.context import ExecutionContext
+
+logger = get_logger(__name__)
 
 
 class Cluster(IResource):
+    __slots__ = ()
 
     def __init__(self, arn: str, name: str = None, tags: list = None, region: str = None):
         # arn:aws:ecs:eu-west-1:389003:cluster/usbim-project-be
@@ -18,15 +22,21 @@ class Cluster(IResource):
             name = arn.split('/')[-1]
         super().__init__(arn, name, tags, region)
 
-    def remove(self):
+    def remove(self, context: 'ExecutionContext' = None):
+        prefix = context.log_prefix() if context else ""
+        logger.info(f"{prefix}Trying to delete resource: {self.arn}")
+
+        if context and context.dry_run:
+            logger.info(f"{prefix}Would delete cluster: {self.name}")
+            return
+
         client = get_client('ecs', self.region)
-        logger.info(f"Trying to delete resource: {self.arn}")
         try:
             response = client.delete_cluster(
                 cluster=self.arn,
             )
             logger.debug(response)
-            logger.info(f"Resource deleted: {self.arn}")
+            logger.info(f"{prefix}Resource deleted: {self.arn}")
         except botocore.exceptions.ClientError as e:
             logger.error(f"Cannot delete resource: {self.arn}")
             logger.debug(e)
@@ -1,43 +1,137 @@
-import os
+
+from typing import TYPE_CHECKING
 
 import botocore.exceptions
-import botocore.errorfactory
 
 from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.utils import get_client, get_base_arn
 from aws_swiffer.utils import get_logger
 
-logger = get_logger(os.path.basename(__file__))
+if TYPE_CHECKING:
+    from aws_swiffer.utils.context import ExecutionContext
+
+logger = get_logger(__name__)
+
+# Inverse service-ARN -> cluster-ARN index, built once per region. Bulk
+# deletions construct many Service objects, and without the index each one
+# would repeat the full cluster fan-out.
+_service_index = {}
+
+
+def _build_service_index(client) -> dict:
+    """Map every service ARN to its cluster with one list_services pass per cluster."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    index = {}
+    clusters = []
+    for page in client.get_paginator('list_clusters').paginate(PaginationConfig={'PageSize': 100}):
+        clusters.extend(page['clusterArns'])
+    if not clusters:
+        return index
+
+    def list_cluster_services(cluster):
+        arns = []
+        for services_page in client.get_paginator('list_services').paginate(
+                cluster=cluster, PaginationConfig={'PageSize': 100}):
+            arns.extend(services_page['serviceArns'])
+        return cluster, arns
+
+    with ThreadPoolExecutor(max_workers=min(16, len(clusters))) as executor:
+        for cluster, arns in executor.map(list_cluster_services, clusters):
+            for service_arn in arns:
+                index[service_arn] = cluster
+    return index
 
 
 class Service(IResource):
+    __slots__ = ('cluster',)
 
     def __init__(self, arn: str, name: str = None, tags: list = None, region: str = None):
         # arn:aws:ecs:eu-west-1:389003:service/usbim-project-be
         if not arn:
             self.arn = f"{get_base_arn('ecs')}:service/{name}"
-        client = get_client('ecs', region)
-        for cluster in client.list_clusters()['clusterArns']:
+        # New-format service ARNs embed the cluster, so most lookups need no
+        # API call at all; only old-format ARNs fall back to the index
+        self.cluster = self._cluster_from_arn(arn)
+        if self.cluster is None:
+            client = get_client('ecs', region)
+            index = _service_index.get(region)
+            if index is None:
+                index = _service_index[region] = _build_service_index(client)
+            # Fall back to the describe fan-out for services created after the
+            # index was built
+            self.cluster = index.get(arn) or self._find_cluster(client, arn)
+        super().__init__(arn, name, tags, region)
+
+    @staticmethod
+    def _cluster_from_arn(arn: str):
+        """
+        Derive the cluster ARN from a new-format service ARN.
+
+        arn:aws:ecs:<region>:<account>:service/<cluster>/<service> names its
+        cluster directly; old-format ARNs (no cluster segment) return None.
+        """
+        if not arn:
+            return None
+        base, _, resource = arn.partition(':service/')
+        if not resource:
+            return None
+        cluster_name, sep, _ = resource.partition('/')
+        if not sep:
+            return None
+        return f"{base}:cluster/{cluster_name}"
+
+    @staticmethod
+    def _find_cluster(client, arn: str):
+        """
+        Locate the cluster running the service with a concurrent describe fan-out.
+
+        Each describe_services probe is an independent round-trip, so candidate
+        clusters are checked in parallel and the first hit wins instead of
+        walking clusters serially; list_clusters is paginated so accounts with
+        more than 100 clusters are not truncated.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        clusters = []
+        paginator = client.get_paginator('list_clusters')
+        for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+            clusters.extend(page['clusterArns'])
+        if not clusters:
+            return None
+
+        def probe(cluster):
             try:
-                services_by_name = client.describe_services(cluster=cluster, services=[arn])['services']
-                if services_by_name:
-                    self.cluster = services_by_name[0]['clusterArn']
-                    break
+                services = client.describe_services(cluster=cluster, services=[arn])['services']
             except client.exceptions.InvalidParameterException as e:
                 logger.debug(e)
-                pass
-        super().__init__(arn, name, tags, region)
+                return None
+            return services[0]['clusterArn'] if services else None
+
+        with ThreadPoolExecutor(max_workers=min(16, len(clusters))) as executor:
+            for found in executor.map(probe, clusters):
+                if found:
+                    return found
+        return None
+
+    def remove(self, context: 'ExecutionContext' = None):
+        prefix = context.log_prefix() if context else ""
+        logger.info(f"{prefix}Trying to delete resource: {self.arn}")
+
+        if context and context.dry_run:
+            logger.info(f"{prefix}Would delete service: {self.arn}")
+            return
 
-    def remove(self):
         client = get_client('ecs', self.region)
-        logger.info(f"Trying to delete resource: {self.arn}")
         try:
             response = client.delete_service(
                 cluster=self.cluster,
                 service=self.arn
             )
             logger.debug(response)
-            logger.info(f"Resource deleted: {self.arn}")
+            logger.info(f"{prefix}Resource deleted: {self.arn}")
+            for index in _service_index.values():
+                index.pop(self.arn, None)
         except botocore.exceptions.ClientError as e:
             logger.error(f"Cannot delete resource: {self.arn}")
             logger.debug(e)
@@ -1,5 +1,5 @@
-import os
-import re
+
+from typing import TYPE_CHECKING
 
 import botocore.exceptions
 
@@ -7,21 +7,79 @@ from aws_swiffer.resources.IResource import IResource
 from aws_swiffer.utils import get_client
 from aws_swiffer.utils import get_logger
 
-logger = get_logger(os.path.basename(__file__))
+if TYPE_CHECKING:
+    from aws_swiffer.utils.context import ExecutionContext
+
+logger = get_logger(__name__)
 
 
 class TaskDefinition(IResource):
+    __slots__ = ('task_definition', 'family', 'revision')
 
     def __init__(self, arn: str, name: str = None, tags: list = None, region: str = None):
         # arn:aws:ecs:eu-west-1:38993287:task-definition/test:155
-        self.task_definition = arn.split('/')[-1]
-        self.family = re.sub(r':[0-9]+', '', self.task_definition)
-        self.revision = self.task_definition.split(':')[-1]
+        self.task_definition = arn.rsplit('/', 1)[-1]
+        # One rpartition splits family:revision in a single C-level scan
+        # instead of a regex substitution plus a second split
+        self.family, sep, self.revision = self.task_definition.rpartition(':')
+        if not sep:
+            # No revision suffix: keep the whole identifier as the family
+            self.family = self.revision
         super().__init__(arn, name, tags, region)
 
-    def remove(self):
+    @staticmethod
+    def remove_many(task_definitions: list, region: str = None):
+        """
+        Batched equivalent of calling remove() per task definition.
+
+        Deregistrations are single-target, so they fan out over a thread pool;
+        delete_task_definitions accepts 10 ARNs per call, so deletions collapse
+        from one call each to one per ten. Per-ARN failures come back in the
+        response and are logged individually.
+
+        Args:
+            task_definitions: family:revision identifiers or ARNs to remove
+            region: AWS region
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        client = get_client('ecs', region)
+        logger.info(f"Trying to delete {len(task_definitions)} task definitions")
+
+        def deregister(task_definition):
+            try:
+                response = client.deregister_task_definition(taskDefinition=task_definition)
+                logger.debug(response)
+            except botocore.exceptions.ClientError:
+                logger.info(f"Cannot deactivate task {task_definition}, trying to delete")
+
+        with ThreadPoolExecutor(max_workers=min(16, len(task_definitions) or 1)) as executor:
+            list(executor.map(deregister, task_definitions))
+
+        deleted = 0
+        # delete_task_definitions accepts up to 10 task definitions per call
+        for i in range(0, len(task_definitions), 10):
+            chunk = task_definitions[i:i + 10]
+            try:
+                response = client.delete_task_definitions(taskDefinitions=chunk)
+                logger.debug(response)
+                deleted += len(response.get('taskDefinitions', []))
+                for failure in response.get('failures', []):
+                    logger.error(f"Cannot delete resource: {failure.get('arn')} ({failure.get('reason')})")
+            except botocore.exceptions.ClientError as e:
+                logger.error(f"Cannot delete task definitions: {' '.join(chunk)}")
+                logger.debug(e)
+        logger.info(f"Deleted {deleted} task definitions")
+
+    def remove(self, context: 'ExecutionContext' = None):
+        prefix = context.log_prefix() if context else ""
+        logger.info(f"{prefix}Trying to delete resource: {self.arn}")
+
+        if context and context.dry_run:
+            logger.info(f"{prefix}Would delete task definition: {self.task_definition}")
+            return
+
         client = get_client('ecs', self.region)
-        logger.info(f"Trying to delete resource: {self.arn}")
         try:
             response = client.deregister_task_definition(
                 taskDefinition=self.task_definition
@@ -34,7 +92,7 @@ class TaskDefinition(IResource):
                 taskDefinitions=[self.task_definition]
             )
             logger.debug(response)
-            logger.info(f"Resource deleted: {self.arn}")
+            logger.info(f"{prefix}Resource deleted: {self.arn}")
         except botocore.exceptions.ClientError as e:
             logger.error(f"Cannot delete resource: {self.arn}")
             logger.debug(e)
@@ -1,4 +1,3 @@
-import os
 from typing import TYPE_CHECKING
 
 import botocore.exceptions
@@ -9,10 +8,11 @@ from aws_swiffer.utils import get_resource, get_logger
 if TYPE_CHECKING:
     from aws_swiffer.utils.context import ExecutionContext
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class Group(IResource):
+    __slots__ = ()
 
     def __init__(self, arn: str, name: str = None, tags: list = None, region: str = None):
         if not name:
@@ -33,13 +33,22 @@ class Group(IResource):
         
         iam = get_resource('iam', self.region)
         group = iam.Group(self.name)
-        group.load()
         try:
-            for userName in group.users.all():
-                response = group.remove_user(
-                    UserName=userName.name
-                )
-                logger.debug(response)
+            from concurrent.futures import ThreadPoolExecutor
+
+            # The get_group paginator returns member names in 1000-entry pages
+            # without building a resource object per user
+            user_names = []
+            paginator = iam.meta.client.get_paginator('get_group')
+            for page in paginator.paginate(GroupName=self.name, PaginationConfig={'PageSize': 1000}):
+                user_names.extend(user['UserName'] for user in page.get('Users', []))
+            if user_names:
+                # There is no batch RemoveUserFromGroup, but each call is
+                # independent and I/O-bound, so they fan out over a pool
+                with ThreadPoolExecutor(max_workers=10) as executor:
+                    for response in executor.map(
+                            lambda user_name: group.remove_user(UserName=user_name), user_names):
+                        logger.debug(response)
             response = group.delete()
             logger.debug(response)
             logger.info(f"{prefix}Resource deleted: {self.arn}")
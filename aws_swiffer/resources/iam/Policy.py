@@ -1,4 +1,3 @@
-import os
 from typing import TYPE_CHECKING
 
 import botocore.exceptions
@@ -9,10 +8,11 @@ from aws_swiffer.utils import get_resource, get_logger
 if TYPE_CHECKING:
     from aws_swiffer.utils.context import ExecutionContext
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class Policy(IResource):
+    __slots__ = ()
 
     def __init__(self, arn: str, name: str = None, tags: list = None, region: str = None):
         # arn:aws:iam::3893287:policy/service-role/CodeBuildBasePolicy-usbim-bcf-dev-eu-west-1
@@ -35,22 +35,38 @@ class Policy(IResource):
         iam = get_resource('iam', self.region)
         policy = iam.Policy(self.arn)
         try:
-            logger.info(f"{prefix}Detach policy from roles")
-            for role in policy.attached_roles.all():
-                policy.detach_role(RoleName=role)
-
-            logger.info(f"{prefix}Detach policy from users")
-            for user in policy.attached_users.all():
-                policy.detach_user(UserName=user)
-
-            logger.info(f"{prefix}Detach policy from groups")
-            for group in policy.attached_groups.all():
-                policy.detach_group(GroupName=group)
-
-            logger.info(f"{prefix}Delete old versions")
-            for policy_version in policy.versions.all():
-                if not policy_version.is_default_version:
-                    policy_version.delete()
+            from concurrent.futures import ThreadPoolExecutor
+
+            # One paginated listing returns every attached role, user and group
+            # in 1000-entry pages instead of three resource-layer iterators
+            # paging at their defaults
+            roles, users, groups = [], [], []
+            paginator = iam.meta.client.get_paginator('list_entities_for_policy')
+            for page in paginator.paginate(PolicyArn=self.arn, PaginationConfig={'PageSize': 1000}):
+                roles.extend(role['RoleName'] for role in page.get('PolicyRoles', []))
+                users.extend(user['UserName'] for user in page.get('PolicyUsers', []))
+                groups.extend(group['GroupName'] for group in page.get('PolicyGroups', []))
+
+            # Each detach and version delete is an independent round-trip, so
+            # they fan out over one pool; everything joins before the delete
+            detach_calls = ([(policy.detach_role, {'RoleName': name}) for name in roles]
+                            + [(policy.detach_user, {'UserName': name}) for name in users]
+                            + [(policy.detach_group, {'GroupName': name}) for name in groups])
+            old_version_ids = []
+            paginator = iam.meta.client.get_paginator('list_policy_versions')
+            for page in paginator.paginate(PolicyArn=self.arn, PaginationConfig={'PageSize': 1000}):
+                old_version_ids.extend(version['VersionId'] for version in page.get('Versions', [])
+                                       if not version['IsDefaultVersion'])
+
+            logger.info(f"{prefix}Detaching policy from {len(roles)} roles, {len(users)} users "
+                        f"and {len(groups)} groups; deleting {len(old_version_ids)} old versions")
+            if detach_calls or old_version_ids:
+                with ThreadPoolExecutor(max_workers=10) as executor:
+                    list(executor.map(lambda call: call[0](**call[1]), detach_calls))
+                    list(executor.map(
+                        lambda version_id: iam.meta.client.delete_policy_version(
+                            PolicyArn=self.arn, VersionId=version_id),
+                        old_version_ids))
 
             response = policy.delete()
             logger.debug(response)
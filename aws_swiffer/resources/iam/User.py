@@ -1,4 +1,3 @@
-import os
 from typing import TYPE_CHECKING
 
 import botocore.exceptions
@@ -9,19 +8,21 @@ from aws_swiffer.utils import get_resource, get_logger, get_client
 if TYPE_CHECKING:
     from aws_swiffer.utils.context import ExecutionContext
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class User(IResource):
+    __slots__ = ('user', 'iam_client')
 
     def __init__(self, arn: str, name: str = None, tags: list = None, region: str = None):
         if not name:
             name = arn.split(':')[-1]
+        # Base initializer first: it resolves name and region, which the
+        # client and resource handles below depend on
+        super().__init__(arn, name, tags, region)
         iam = get_resource('iam', self.region)
         self.user = iam.User(self.name)
-        self.user.load()
         self.iam_client = get_client('iam', self.region)
-        super().__init__(arn, name, tags, region)
 
     def remove(self, context: 'ExecutionContext' = None):
         prefix = context.log_prefix() if context else ""
@@ -36,9 +37,24 @@ class User(IResource):
             return
         
         try:
-            self.delete_all_accesses()
-            self.detach_policies()
-            self.delete_from_groups()
+            from concurrent.futures import ThreadPoolExecutor
+
+            # Credentials, SSH keys, codecommit credentials, MFA devices,
+            # console access, policies and groups are disjoint IAM entities, so
+            # the subtasks fan out and the final delete waits for all of them
+            subtasks = [
+                lambda: self.disable_credentials(True),
+                lambda: self.disable_ssh_public_keys(True),
+                lambda: self.disable_codecommit_credentials(True),
+                self.delete_mfa_devices,
+                self.disable_console_access,
+                self.detach_policies,
+                self.delete_from_groups,
+            ]
+            with ThreadPoolExecutor(max_workers=len(subtasks)) as executor:
+                futures = [executor.submit(subtask) for subtask in subtasks]
+                for future in futures:
+                    future.result()
             response = self.user.delete()
             logger.debug(response)
             logger.info(f"{prefix}Resource deleted: {self.arn}")
@@ -54,11 +70,15 @@ class User(IResource):
         self.disable_console_access()
 
     def disable_credentials(self, delete: bool = False):
-        access_keys = self.user.access_keys.all()
-        for access_key in access_keys:
-            access_key.deactivate()
-            if delete:
-                access_key.delete()
+        # Low-level paginator: 1000-entry pages, no resource object per key
+        paginator = self.iam_client.get_paginator('list_access_keys')
+        for page in paginator.paginate(UserName=self.name, PaginationConfig={'PageSize': 1000}):
+            for access_key in page.get('AccessKeyMetadata', []):
+                key_id = access_key['AccessKeyId']
+                self.iam_client.update_access_key(UserName=self.name, AccessKeyId=key_id,
+                                                  Status='Inactive')
+                if delete:
+                    self.iam_client.delete_access_key(UserName=self.name, AccessKeyId=key_id)
         logger.info(f"[{self.arn}]: Credentials %s", "deleted" if delete else "disabled")
 
     def disable_ssh_public_keys(self, delete: bool = False):
@@ -90,22 +110,33 @@ class User(IResource):
         logger.debug(f"[{self.arn}]: Console access disabled")
 
     def detach_policies(self):
-        for policy in self.user.attached_policies.all():
-            logger.debug(f"[{self.arn}] - Remove policy {policy.arn}")
-            self.user.detach_policies(PolicyArn=policy.arn)
-
-        for policy in self.user.attached_policies.all():
-            logger.debug(f"[{self.arn}] - Remove inline policy {policy.arn}")
-            policy.delete()
+        paginator = self.iam_client.get_paginator('list_attached_user_policies')
+        for page in paginator.paginate(UserName=self.name, PaginationConfig={'PageSize': 1000}):
+            for policy in page.get('AttachedPolicies', []):
+                logger.debug(f"[{self.arn}] - Remove policy {policy['PolicyArn']}")
+                self.iam_client.detach_user_policy(UserName=self.name, PolicyArn=policy['PolicyArn'])
+
+        # Inline policies live on the user itself and are deleted, not detached
+        paginator = self.iam_client.get_paginator('list_user_policies')
+        for page in paginator.paginate(UserName=self.name, PaginationConfig={'PageSize': 1000}):
+            for policy_name in page.get('PolicyNames', []):
+                logger.debug(f"[{self.arn}] - Remove inline policy {policy_name}")
+                self.iam_client.delete_user_policy(UserName=self.name, PolicyName=policy_name)
 
     def delete_from_groups(self):
-        for group in self.user.groups.all():
-            logger.debug(f"[{self.arn}] Remove from group {group.group_name}")
-            group.remove_user(UserName=self.name)
+        paginator = self.iam_client.get_paginator('list_groups_for_user')
+        for page in paginator.paginate(UserName=self.name, PaginationConfig={'PageSize': 1000}):
+            for group in page.get('Groups', []):
+                logger.debug(f"[{self.arn}] Remove from group {group['GroupName']}")
+                self.iam_client.remove_user_from_group(GroupName=group['GroupName'],
+                                                       UserName=self.name)
 
     def delete_mfa_devices(self):
         # Iterate through the devices and delete them
-        for device in self.user.mfa_devices.all():
-            device.disassociate()
+        paginator = self.iam_client.get_paginator('list_mfa_devices')
+        for page in paginator.paginate(UserName=self.name, PaginationConfig={'PageSize': 1000}):
+            for device in page.get('MFADevices', []):
+                self.iam_client.deactivate_mfa_device(UserName=self.name,
+                                                      SerialNumber=device['SerialNumber'])
 
         logger.debug(f"[{self.arn}]: All MFA devices deleted ")
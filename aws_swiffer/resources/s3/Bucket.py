@@ -1,18 +1,18 @@
-import os
 from typing import TYPE_CHECKING
 
 import botocore.exceptions
 
 from aws_swiffer.resources.IResource import IResource
-from aws_swiffer.utils import get_resource, get_logger
+from aws_swiffer.utils import get_client, get_resource, get_logger
 
 if TYPE_CHECKING:
     from aws_swiffer.utils.context import ExecutionContext
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class Bucket(IResource):
+    __slots__ = ('s3', 'bucket')
 
     def __init__(self, arn: str, name: str = None, tags: list = None, region: str = None):
         if not name:
@@ -51,21 +51,53 @@ class Bucket(IResource):
             logger.error(f"Cannot delete resource: {self.arn}")
             logger.debug(e)
 
+    def _pipelined_delete(self, client, pages, to_objects):
+        """
+        Delete each listed page's objects while the next page is being listed.
+
+        Listing chains on a continuation token so pages arrive serially, but
+        each DeleteObjects call is independent; submitting them to a pool
+        hides the delete latency behind the next list round-trip instead of
+        alternating list, delete, list, delete.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        futures = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for page in pages:
+                objects = to_objects(page)
+                if objects:
+                    futures.append(executor.submit(client.delete_objects, Bucket=self.name,
+                                                   Delete={'Objects': objects, 'Quiet': True}))
+            for future in as_completed(futures):
+                future.result()
+
     def clean(self, context: 'ExecutionContext' = None):
         prefix = context.log_prefix() if context else ""
-        
+
         if context and context.dry_run:
             logger.info(f"{prefix}Would clean bucket: {self.name}")
             return
-        
+
+        client = get_client('s3', self.region)
         try:
             logger.info(f'{prefix}Start clean for: {self.arn}')
             logger.info(f'{prefix}Trying to delete old versions')
-            self.bucket.object_versions.delete()
+            # DeleteObjects accepts up to 1000 keys, so delete page by page instead of key by key
+            paginator = client.get_paginator('list_object_versions')
+            self._pipelined_delete(
+                client,
+                paginator.paginate(Bucket=self.name, PaginationConfig={'PageSize': 1000}),
+                lambda page: [{'Key': v['Key'], 'VersionId': v['VersionId']}
+                              for v in page.get('Versions', []) + page.get('DeleteMarkers', [])])
             logger.info(f'{prefix}Old file versions deleted ')
         except botocore.exceptions.ClientError as e:
             logger.debug(e)
         else:
             logger.info(f"{prefix}Start delete of all objects in bucket")
-            self.bucket.objects.all().delete()
+            paginator = client.get_paginator('list_objects_v2')
+            self._pipelined_delete(
+                client,
+                paginator.paginate(Bucket=self.name, PaginationConfig={'PageSize': 1000}),
+                lambda page: [{'Key': obj['Key']} for obj in page.get('Contents', [])])
             logger.info(f"{prefix}Delete of all objects completed")
\ No newline at end of file
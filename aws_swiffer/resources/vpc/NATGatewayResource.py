@@ -1,7 +1,9 @@
 """NAT Gateway Resource class for AWS Swiffer VPC resources."""
 
-import os
+import logging
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Optional, List, Dict
 
 import botocore.exceptions
@@ -12,7 +14,23 @@ from aws_swiffer.utils import get_client, get_logger
 if TYPE_CHECKING:
     from aws_swiffer.utils.context import ExecutionContext
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
+
+# Deletion polling backs off exponentially from the base up to the cap,
+# with ±20% jitter so concurrent waiters don't synchronize their describes
+_POLL_BASE_SECONDS = 1
+_POLL_CAP_SECONDS = 30
+
+# Route-table listings keyed by (region, vpc_id). Every NAT gateway in a VPC
+# checks and cleans against the same listing, so within the TTL a K-gateway
+# sweep issues one DescribeRouteTables instead of 2K.
+_ROUTE_TABLES_CACHE_TTL_SECONDS = 60
+_route_tables_cache = {}
+
+# Routes referencing NAT gateways, keyed by (region, vpc_id) and then by
+# NatGatewayId; built once per cached listing so per-gateway lookups are O(1)
+# instead of re-scanning every route of every table
+_nat_route_index_cache = {}
 
 
 class NATGatewayResource(VPCResource):
@@ -55,6 +73,9 @@ class NATGatewayResource(VPCResource):
         self.nat_gateway_type = nat_gateway_type
         self.connectivity_type = connectivity_type
         self._ec2_client = None
+        # Last DescribeNatGateways entry: None means not fetched yet, an empty
+        # dict means the gateway was looked up and is gone
+        self._state_cache: Optional[dict] = None
     
     @property
     def ec2_client(self):
@@ -63,7 +84,7 @@ class NATGatewayResource(VPCResource):
             self._ec2_client = get_client('ec2', self.region)
         return self._ec2_client
     
-    def is_default_resource(self) -> bool:
+    def _compute_is_default(self) -> bool:
         """
         Check if this is a default NAT Gateway.
         
@@ -75,29 +96,137 @@ class NATGatewayResource(VPCResource):
         """
         return False
     
+    @staticmethod
+    def describe_by_ids(nat_gateway_ids: List[str], region: str = None) -> Dict[str, dict]:
+        """
+        Describe many NAT gateways, one DescribeNatGateways call per 1000 IDs.
+
+        Bulk sweeps should fetch states through this instead of letting every
+        instance issue its own single-ID describe: N lookups collapse into
+        ceil(N/1000) round-trips.
+
+        Args:
+            nat_gateway_ids: NAT Gateway IDs to describe
+            region: AWS region
+
+        Returns:
+            Mapping of NAT Gateway ID to its DescribeNatGateways entry
+        """
+        ec2 = get_client('ec2', region)
+        described = {}
+        # DescribeNatGateways accepts up to 1000 IDs per call; the filter form
+        # returns an empty list for missing IDs instead of raising NotFound
+        for i in range(0, len(nat_gateway_ids), 1000):
+            chunk = nat_gateway_ids[i:i + 1000]
+            try:
+                paginator = ec2.get_paginator('describe_nat_gateways')
+                pages = paginator.paginate(
+                    Filters=[{'Name': 'nat-gateway-id', 'Values': chunk}])
+                for page in pages:
+                    for nat_gateway in page.get('NatGateways', []):
+                        described[nat_gateway['NatGatewayId']] = nat_gateway
+            except botocore.exceptions.ClientError as e:
+                logger.error(f"Cannot describe NAT Gateways: {' '.join(chunk)}")
+                logger.debug(e)
+        return described
+
+    def _refresh_state(self, force: bool = False) -> Optional[dict]:
+        """
+        Fetch this NAT Gateway's description, reusing the cache unless forced.
+
+        exists, can_delete and the deletion waiter all need the same
+        description; caching it on the instance means one describe serves all
+        of them until remove() invalidates after issuing the delete.
+
+        Args:
+            force: Bypass the cached description and describe again
+
+        Returns:
+            The DescribeNatGateways entry, or None when the gateway is gone
+        """
+        if not force and self._state_cache is not None:
+            return self._state_cache or None
+
+        try:
+            # The filter form reports a missing gateway as an empty list where
+            # NatGatewayIds= raises InvalidNatGatewayID.NotFound; the deletion
+            # waiter hits that case on every successful delete, so the normal
+            # path stays exception-free
+            response = self.ec2_client.describe_nat_gateways(
+                Filters=[{'Name': 'nat-gateway-id', 'Values': [self.nat_gateway_id]}])
+            nat_gateways = response['NatGateways']
+        except botocore.exceptions.ClientError as e:
+            if e.response['Error']['Code'] == 'InvalidNatGatewayID.NotFound':
+                self._state_cache = {}
+                return None
+            raise
+
+        if not nat_gateways:
+            self._state_cache = {}
+            return None
+
+        self._state_cache = nat_gateways[0]
+        self.state = nat_gateways[0]['State']
+        return self._state_cache
+
+    @classmethod
+    def remove_many(cls, resources: List['NATGatewayResource'], context: 'ExecutionContext' = None,
+                    max_workers: int = 8) -> None:
+        """
+        Clean and remove many NAT gateways concurrently.
+
+        Each gateway's clean-then-remove sequence is I/O-bound on AWS calls,
+        so a sequential sweep costs the sum of every describe, delete and
+        wait. Fanning the sequences out over a bounded pool brings that close
+        to the slowest gateway; gateways in the same VPC also share the
+        cached route-table listing and index instead of refetching them.
+
+        Args:
+            resources: NAT Gateway resources to clean and remove
+            context: Optional ExecutionContext for dry-run and auto-approve modes
+            max_workers: Upper bound on concurrent gateway removals
+        """
+        if not resources:
+            return
+
+        def clean_and_remove(resource: 'NATGatewayResource') -> None:
+            resource.clean(context)
+            resource.remove(context)
+
+        # Per-gateway failures are caught and counted so one bad gateway
+        # cannot abort the rest of the sweep
+        failures = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(clean_and_remove, resource): resource
+                       for resource in resources}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    failures += 1
+                    logger.error(f"Failed to remove NAT Gateway "
+                                 f"{futures[future].nat_gateway_id}: {e}")
+        logger.info("NAT Gateway sweep complete: %d succeeded, %d failed",
+                    len(futures) - failures, failures)
+
     def exists(self) -> bool:
         """
         Check if the NAT Gateway still exists in AWS.
-        
+
         Returns:
             True if NAT Gateway exists, False otherwise
         """
         try:
-            response = self.ec2_client.describe_nat_gateways(NatGatewayIds=[self.nat_gateway_id])
-            nat_gateways = response['NatGateways']
-            
-            if not nat_gateways:
-                return False
-            
-            # Check if NAT Gateway is in a deleted state
-            state = nat_gateways[0]['State']
-            return state not in ['deleted', 'failed']
-        
+            nat_gateway = self._refresh_state()
         except botocore.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'InvalidNatGatewayID.NotFound':
-                return False
             logger.error(f"Error checking NAT Gateway existence: {e}")
             return True  # Assume exists if we can't determine
+
+        if nat_gateway is None:
+            return False
+
+        # Check if NAT Gateway is in a deleted state
+        return nat_gateway['State'] not in ['deleted', 'failed']
     
     def can_delete(self) -> bool:
         """
@@ -111,17 +240,24 @@ class NATGatewayResource(VPCResource):
         """
         if not super().can_delete():
             return False
-        
+
+        # The in-object state comes from the listing that enumerated this
+        # gateway (and _refresh_state keeps it current); none of these states
+        # permit deletion, so a describe could not change the answer
+        if self.state in ('deleted', 'deleting', 'pending'):
+            logger.warning(f"NAT Gateway {self.nat_gateway_id} is in state '{self.state}' "
+                         "and cannot be deleted")
+            return False
+
         # Check current state
         try:
-            response = self.ec2_client.describe_nat_gateways(NatGatewayIds=[self.nat_gateway_id])
-            nat_gateways = response['NatGateways']
-            
-            if not nat_gateways:
+            nat_gateway = self._refresh_state()
+
+            if nat_gateway is None:
                 logger.warning(f"NAT Gateway {self.nat_gateway_id} not found")
                 return False
-            
-            current_state = nat_gateways[0]['State']
+
+            current_state = nat_gateway['State']
             
             # Can only delete NAT Gateways in available or failed state
             if current_state not in ['available', 'failed']:
@@ -139,34 +275,96 @@ class NATGatewayResource(VPCResource):
             logger.error(f"Error checking NAT Gateway {self.nat_gateway_id}: {e}")
             return False
     
+    @classmethod
+    def invalidate_route_tables_cache(cls, vpc_id: str = None) -> None:
+        """
+        Drop cached route-table listings.
+
+        Args:
+            vpc_id: Clear only this VPC's entries, or everything when omitted
+        """
+        for cache in (_route_tables_cache, _nat_route_index_cache):
+            if vpc_id is None:
+                cache.clear()
+            else:
+                for key in [k for k in cache if k[1] == vpc_id]:
+                    del cache[key]
+
+    def _describe_route_tables(self) -> List[dict]:
+        """
+        List the VPC's route tables, cached per (region, vpc_id) for the TTL.
+
+        Returns:
+            Route table entries as returned by DescribeRouteTables
+        """
+        key = (self.region, self.vpc_id)
+        cached = _route_tables_cache.get(key)
+        if cached is not None:
+            route_tables, cached_at = cached
+            if time.monotonic() - cached_at < _ROUTE_TABLES_CACHE_TTL_SECONDS:
+                return route_tables
+
+        response = self.ec2_client.describe_route_tables(
+            Filters=[
+                {'Name': 'vpc-id', 'Values': [self.vpc_id]}
+            ]
+        )
+        route_tables = response['RouteTables']
+        _route_tables_cache[key] = (route_tables, time.monotonic())
+        return route_tables
+
+    def _nat_route_index(self) -> Dict[str, List[tuple]]:
+        """
+        Index the VPC's NAT-gateway routes by NatGatewayId.
+
+        Scanning every route of every table once per gateway is
+        O(gateways x tables x routes); the index is built once per cached
+        listing and each gateway's lookup becomes a dict hit.
+
+        Returns:
+            Mapping of NatGatewayId to (route_table_id, destination, is_ipv6) tuples
+        """
+        key = (self.region, self.vpc_id)
+        cached = _nat_route_index_cache.get(key)
+        if cached is not None:
+            index, cached_at = cached
+            if time.monotonic() - cached_at < _ROUTE_TABLES_CACHE_TTL_SECONDS:
+                return index
+
+        index = {}
+        for route_table in self._describe_route_tables():
+            route_table_id = route_table['RouteTableId']
+            for route in route_table.get('Routes', []):
+                nat_gateway_id = route.get('NatGatewayId')
+                if not nat_gateway_id:
+                    continue
+                destination = route.get('DestinationCidrBlock') or route.get('DestinationIpv6CidrBlock')
+                if destination:
+                    index.setdefault(nat_gateway_id, []).append(
+                        (route_table_id, destination, 'DestinationIpv6CidrBlock' in route))
+        _nat_route_index_cache[key] = (index, time.monotonic())
+        return index
+
     def _check_route_table_references(self) -> bool:
         """
         Check if any route tables reference this NAT Gateway.
-        
+
         Returns:
             True if no references found, False if references exist
         """
         try:
-            response = self.ec2_client.describe_route_tables(
-                Filters=[
-                    {'Name': 'vpc-id', 'Values': [self.vpc_id]}
-                ]
-            )
-            
-            for route_table in response['RouteTables']:
-                for route in route_table.get('Routes', []):
-                    if route.get('NatGatewayId') == self.nat_gateway_id:
-                        route_table_id = route_table['RouteTableId']
-                        destination = route.get('DestinationCidrBlock', route.get('DestinationIpv6CidrBlock', 'unknown'))
-                        logger.warning(f"NAT Gateway {self.nat_gateway_id} is referenced by route table "
-                                     f"{route_table_id} for destination {destination}")
-                        return False
-            
-            return True
-        
+            references = self._nat_route_index().get(self.nat_gateway_id)
         except botocore.exceptions.ClientError as e:
             logger.error(f"Error checking route table references for NAT Gateway {self.nat_gateway_id}: {e}")
             return False
+
+        if references:
+            route_table_id, destination, _ = references[0]
+            logger.warning(f"NAT Gateway {self.nat_gateway_id} is referenced by route table "
+                         f"{route_table_id} for destination {destination}")
+            return False
+
+        return True
     
     def remove(self, context: 'ExecutionContext' = None) -> None:
         """
@@ -196,11 +394,16 @@ class NATGatewayResource(VPCResource):
         
         try:
             response = self.ec2_client.delete_nat_gateway(NatGatewayId=self.nat_gateway_id)
+            # The gateway is transitioning now; the cached description is stale
+            self._state_cache = None
             logger.info(f"{prefix}Initiated deletion of NAT Gateway: {self.nat_gateway_id}")
-            
+
             # Wait for deletion to complete if requested
             if context and hasattr(context, 'wait_for_completion') and context.wait_for_completion:
-                self._wait_for_deletion(context)
+                # The delete response already carries the post-delete state,
+                # so the waiter can skip its first describe round-trip
+                initial_state = response.get('NatGateway', {}).get('State')
+                self._wait_for_deletion(context, initial_state=initial_state)
         
         except botocore.exceptions.ClientError as e:
             error_code = e.response['Error']['Code']
@@ -221,51 +424,98 @@ class NATGatewayResource(VPCResource):
             
             logger.debug(f"Full error details: {e}")
     
-    def _wait_for_deletion(self, context: 'ExecutionContext' = None, max_wait_time: int = 300) -> None:
+    @staticmethod
+    def _next_poll_interval(attempt: int) -> float:
+        """
+        Compute the sleep before the next deletion poll.
+
+        Truncated exponential backoff with jitter: quick deletions are detected
+        within seconds while long ones settle at the cap instead of hammering
+        the API at a constant rate.
+
+        Args:
+            attempt: Number of polls already made since the last state change
+
+        Returns:
+            Sleep duration in seconds
+        """
+        return min(_POLL_BASE_SECONDS * 2 ** attempt, _POLL_CAP_SECONDS) * random.uniform(0.8, 1.2)
+
+    def _wait_for_deletion(self, context: 'ExecutionContext' = None, max_wait_time: int = 300,
+                           initial_state: str = None) -> None:
         """
         Wait for NAT Gateway deletion to complete.
-        
+
         Args:
             context: ExecutionContext for logging
             max_wait_time: Maximum time to wait in seconds (default: 5 minutes)
+            initial_state: State already reported by the delete response, if any
         """
         prefix = context.log_prefix() if context else ""
         start_time = time.time()
-        
+
         logger.info(f"{prefix}Waiting for NAT Gateway {self.nat_gateway_id} deletion to complete...")
-        
+
+        # A large sweep waits on many gateways at once; the per-poll line only
+        # exists (and is only formatted) when DEBUG is actually on, and the
+        # outcome is one record with poll counters instead of per-poll spam
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        polls = 0
+        attempt = 0
+        last_state = None
+        if initial_state == 'deleted':
+            logger.info("%sNAT Gateway %s deleted in %.1fs after %d polls",
+                        prefix, self.nat_gateway_id, time.time() - start_time, polls)
+            return
+        if initial_state == 'deleting':
+            # The state is already known, so sleep before the first describe
+            # instead of immediately re-asking for what the delete call returned
+            last_state = initial_state
+            time.sleep(self._next_poll_interval(attempt))
+            attempt += 1
         while time.time() - start_time < max_wait_time:
             try:
-                response = self.ec2_client.describe_nat_gateways(NatGatewayIds=[self.nat_gateway_id])
-                nat_gateways = response['NatGateways']
-                
-                if not nat_gateways:
-                    logger.info(f"{prefix}NAT Gateway {self.nat_gateway_id} deleted successfully")
-                    return
-                
-                state = nat_gateways[0]['State']
-                
-                if state == 'deleted':
-                    logger.info(f"{prefix}NAT Gateway {self.nat_gateway_id} deleted successfully")
+                nat_gateway = self._refresh_state(force=True)
+                polls += 1
+
+                if nat_gateway is None or nat_gateway['State'] == 'deleted':
+                    logger.info("%sNAT Gateway %s deleted in %.1fs after %d polls",
+                                prefix, self.nat_gateway_id, time.time() - start_time, polls)
                     return
-                elif state == 'failed':
-                    logger.error(f"{prefix}NAT Gateway {self.nat_gateway_id} deletion failed")
+
+                state = nat_gateway['State']
+
+                if state == 'failed':
+                    logger.error("%sNAT Gateway %s deletion failed after %.1fs and %d polls",
+                                 prefix, self.nat_gateway_id, time.time() - start_time, polls)
                     return
-                elif state == 'deleting':
-                    logger.debug(f"{prefix}NAT Gateway {self.nat_gateway_id} is still deleting...")
-                else:
-                    logger.warning(f"{prefix}NAT Gateway {self.nat_gateway_id} in unexpected state: {state}")
-                
-                time.sleep(10)  # Wait 10 seconds between checks
-            
+
+                if state != last_state:
+                    # A transition means the next change may be close, so the
+                    # backoff resets and polling tightens again; unexpected
+                    # states are reported once here, not on every poll
+                    attempt = 0
+                    if state != 'deleting':
+                        logger.warning(f"{prefix}NAT Gateway {self.nat_gateway_id} "
+                                       f"in unexpected state: {state}")
+                    last_state = state
+                elif debug_enabled:
+                    logger.debug(f"{prefix}NAT Gateway {self.nat_gateway_id} still in state "
+                                 f"{state} after {polls} polls")
+
+                time.sleep(self._next_poll_interval(attempt))
+                attempt += 1
+
             except botocore.exceptions.ClientError as e:
                 if e.response['Error']['Code'] == 'InvalidNatGatewayID.NotFound':
-                    logger.info(f"{prefix}NAT Gateway {self.nat_gateway_id} deleted successfully")
+                    logger.info("%sNAT Gateway %s deleted in %.1fs after %d polls",
+                                prefix, self.nat_gateway_id, time.time() - start_time, polls)
                     return
                 logger.error(f"{prefix}Error checking NAT Gateway deletion status: {e}")
                 break
-        
-        logger.warning(f"{prefix}Timeout waiting for NAT Gateway {self.nat_gateway_id} deletion")
+
+        logger.warning("%sTimeout waiting for NAT Gateway %s deletion after %.1fs and %d polls",
+                       prefix, self.nat_gateway_id, time.time() - start_time, polls)
     
     def clean(self, context: 'ExecutionContext' = None) -> None:
         """
@@ -291,65 +541,60 @@ class NATGatewayResource(VPCResource):
             context: ExecutionContext for dry-run and auto-approve modes
         """
         prefix = context.log_prefix() if context else ""
-        
+
         try:
-            response = self.ec2_client.describe_route_tables(
-                Filters=[
-                    {'Name': 'vpc-id', 'Values': [self.vpc_id]}
-                ]
-            )
-            
-            for route_table in response['RouteTables']:
-                route_table_id = route_table['RouteTableId']
-                routes_to_delete = []
-                
-                for route in route_table.get('Routes', []):
-                    if route.get('NatGatewayId') == self.nat_gateway_id:
-                        destination = route.get('DestinationCidrBlock') or route.get('DestinationIpv6CidrBlock')
-                        if destination:
-                            routes_to_delete.append({
-                                'destination': destination,
-                                'is_ipv6': 'DestinationIpv6CidrBlock' in route
-                            })
-                
-                # Delete routes that reference this NAT Gateway
-                for route_info in routes_to_delete:
-                    destination = route_info['destination']
-                    is_ipv6 = route_info['is_ipv6']
-                    
-                    logger.info(f"{prefix}Removing route to {destination} via NAT Gateway "
-                              f"{self.nat_gateway_id} from route table {route_table_id}")
-                    
-                    if context and context.dry_run:
-                        logger.info(f"{prefix}Would remove route: {destination} -> {self.nat_gateway_id}")
-                        continue
-                    
-                    try:
-                        if is_ipv6:
-                            self.ec2_client.delete_route(
-                                RouteTableId=route_table_id,
-                                DestinationIpv6CidrBlock=destination
-                            )
-                        else:
-                            self.ec2_client.delete_route(
-                                RouteTableId=route_table_id,
-                                DestinationCidrBlock=destination
-                            )
-                        
-                        logger.info(f"{prefix}Removed route: {destination} -> {self.nat_gateway_id}")
-                    
-                    except botocore.exceptions.ClientError as e:
-                        error_code = e.response['Error']['Code']
-                        if error_code == 'InvalidRoute.NotFound':
-                            logger.debug(f"{prefix}Route {destination} -> {self.nat_gateway_id} "
-                                       "not found - may have been removed already")
-                        else:
-                            logger.error(f"{prefix}Failed to remove route {destination} -> "
-                                       f"{self.nat_gateway_id}: {e}")
-        
+            # The prebuilt index holds this gateway's referencing routes as
+            # (route_table_id, destination, is_ipv6) tuples; each delete_route
+            # is an independent round-trip that can fan out below
+            routes_to_delete = self._nat_route_index().get(self.nat_gateway_id, [])
         except botocore.exceptions.ClientError as e:
             logger.error(f"{prefix}Error cleaning route table references for NAT Gateway "
                         f"{self.nat_gateway_id}: {e}")
+            return
+
+        if not routes_to_delete:
+            return
+
+        if context and context.dry_run:
+            for route_table_id, destination, _ in routes_to_delete:
+                logger.info(f"{prefix}Would remove route: {destination} -> {self.nat_gateway_id} "
+                            f"from route table {route_table_id}")
+            return
+
+        def delete_route(route_table_id: str, destination: str, is_ipv6: bool) -> bool:
+            logger.info(f"{prefix}Removing route to {destination} via NAT Gateway "
+                      f"{self.nat_gateway_id} from route table {route_table_id}")
+            try:
+                if is_ipv6:
+                    self.ec2_client.delete_route(
+                        RouteTableId=route_table_id,
+                        DestinationIpv6CidrBlock=destination
+                    )
+                else:
+                    self.ec2_client.delete_route(
+                        RouteTableId=route_table_id,
+                        DestinationCidrBlock=destination
+                    )
+
+                logger.info(f"{prefix}Removed route: {destination} -> {self.nat_gateway_id}")
+                return True
+
+            except botocore.exceptions.ClientError as e:
+                error_code = e.response['Error']['Code']
+                if error_code == 'InvalidRoute.NotFound':
+                    logger.debug(f"{prefix}Route {destination} -> {self.nat_gateway_id} "
+                               "not found - may have been removed already")
+                else:
+                    logger.error(f"{prefix}Failed to remove route {destination} -> "
+                               f"{self.nat_gateway_id}: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            deleted_any = any(list(executor.map(lambda args: delete_route(*args),
+                                                routes_to_delete)))
+        if deleted_any:
+            # The cached listing no longer reflects the VPC's routes
+            self.invalidate_route_tables_cache(self.vpc_id)
     
     def __str__(self) -> str:
         """String representation of the NAT Gateway resource."""
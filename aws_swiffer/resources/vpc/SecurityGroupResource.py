@@ -1,6 +1,5 @@
 """Security Group Resource class for AWS Swiffer VPC resources."""
 
-import os
 from typing import TYPE_CHECKING, Optional, List, Dict
 
 import botocore.exceptions
@@ -11,7 +10,7 @@ from aws_swiffer.utils import get_client, get_logger
 if TYPE_CHECKING:
     from aws_swiffer.utils.context import ExecutionContext
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class SecurityGroupResource(VPCResource):
@@ -58,7 +57,7 @@ class SecurityGroupResource(VPCResource):
             self._ec2_client = get_client('ec2', self.region)
         return self._ec2_client
     
-    def is_default_resource(self) -> bool:
+    def _compute_is_default(self) -> bool:
         """
         Check if this is a default security group.
         
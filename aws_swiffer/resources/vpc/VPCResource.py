@@ -1,6 +1,5 @@
 """Base VPC Resource class for AWS Swiffer VPC resources."""
 
-import os
 from typing import TYPE_CHECKING, List, Optional
 from abc import abstractmethod
 
@@ -10,7 +9,7 @@ from aws_swiffer.utils import get_logger
 if TYPE_CHECKING:
     from aws_swiffer.utils.context import ExecutionContext
 
-logger = get_logger(os.path.basename(__file__))
+logger = get_logger(__name__)
 
 
 class VPCResource(IResource):
@@ -39,6 +38,9 @@ class VPCResource(IResource):
         self.resource_type = resource_type
         self.dependencies: List['VPCResource'] = []
         self.dependents: List['VPCResource'] = []
+        # Tags as a dict, computed once so tag filters never re-parse the list
+        self.tag_dict = {tag.get('Key', ''): tag.get('Value', '')
+                         for tag in (tags or []) if isinstance(tag, dict)}
     
     def is_default_resource(self) -> bool:
         """
@@ -50,10 +52,21 @@ class VPCResource(IResource):
         - Main route tables
         - Default network ACLs
         
+        The first check is computed once and cached on the instance: whether a
+        resource is an AWS default cannot change while the CLI runs, and some
+        subclasses answer it with an API round-trip.
+        
         Returns:
             True if this is a default resource, False otherwise
         """
-        # Base implementation - subclasses should override for specific logic
+        cached = getattr(self, '_is_default_cache', None)
+        if cached is None:
+            cached = self._compute_is_default()
+            self._is_default_cache = cached
+        return cached
+    
+    def _compute_is_default(self) -> bool:
+        """Compute default-ness; subclasses override for specific logic."""
         return False
     
     def get_dependencies(self) -> List['VPCResource']:
@@ -2,5 +2,7 @@ from .logger import get_logger
 from .aws import get_client, get_resource, get_base_arn, get_account_info
 from .input import ask_delete_confirm, prompt_input_tags, parse_input_tags, get_tags, no_yes_dialog
 from .helper import validate_arn
+from .region import current_region, invalidate_region
+from .bulk import bulk_remove
 from .callback import callback_base, callback_check_account
 from .context import ExecutionContext
\ No newline at end of file
@@ -1,20 +1,60 @@
-import boto3
-from botocore.config import Config
+import functools
+import hashlib
+import json
 import os
+import threading
+import time
+from pathlib import Path
 
+# Account identity is stable per (profile, region), so the STS + IAM round
+# trips behind get_account_info are cached on disk with a short TTL; scripted
+# pipelines invoking many subcommands in a row pay them once instead of per
+# process.
+_ACCOUNT_INFO_TTL_SECONDS = 300
+
+session = None
 clients = {}
 resources = {}
 
+# Client construction is expensive (endpoint resolution, signer setup, model
+# loading) and the caches are now hit from worker threads; the lock makes a
+# cache miss build exactly one client per (service, region).
+_cache_lock = threading.Lock()
+
+
+def get_session():
+    # boto3 is imported lazily: walking its service data files costs hundreds of
+    # milliseconds, which would be paid on every CLI invocation (even --help).
+    # Per-service JSON models are only parsed when a client for that service is
+    # first requested below, so an invocation never loads data for the other
+    # services the CLI supports.
+    global session
+    if session is None:
+        import boto3
+        session = boto3.session.Session()
+    return session
+
+
+def _build_config(region: str):
+    # Shared by every client: adaptive retries absorb throttling during bulk
+    # cleanups, keepalive reuses TCP connections across calls, and the bounded
+    # timeouts stop a stuck endpoint from hanging a whole worker pool.
+    from botocore.config import Config
+    return Config(region_name=region, max_pool_connections=50, tcp_keepalive=True,
+                  connect_timeout=5, read_timeout=30,
+                  retries={'mode': 'adaptive', 'max_attempts': 10})
+
 
 def get_client(service_name: str, region: str = None):
     if not region:
         region = os.getenv('AWS_REGION', 'eu-west-1')
 
-    my_config = Config(region_name=region)
     key = service_name + '_' + region
 
-    if service_name not in clients:
-        clients[key] = boto3.client(service_name, config=my_config)
+    if key not in clients:
+        with _cache_lock:
+            if key not in clients:
+                clients[key] = get_session().client(service_name, config=_build_config(region))
 
     return clients[key]
 
@@ -23,16 +63,23 @@ def get_resource(service_name: str, region: str = None):
     if not region:
         region = os.getenv('AWS_REGION', 'eu-west-1')
 
-    my_config = Config(region_name=region)
     key = service_name + '_' + region
 
     if key not in resources:
-        resources[key] = boto3.resource(service_name, config=my_config)
+        with _cache_lock:
+            if key not in resources:
+                resources[key] = get_session().resource(service_name, config=_build_config(region))
 
     return resources[key]
 
 
-def get_account_info():
+def _account_info_cache_path():
+    key = f"{os.environ.get('AWS_PROFILE', 'default')}:{os.environ.get('AWS_REGION', '')}"
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return Path.home() / '.cache' / 'aws_swiffer' / f'acct-{digest}.json'
+
+
+def _fetch_account_info():
     sts = get_client('sts')
     iam = get_client('iam')
     caller_identity = sts.get_caller_identity()
@@ -41,7 +88,30 @@ def get_account_info():
     return caller_identity
 
 
+def get_account_info():
+    path = _account_info_cache_path()
+    try:
+        if path.exists() and time.time() - path.stat().st_mtime < _ACCOUNT_INFO_TTL_SECONDS:
+            return json.loads(path.read_text())
+    except (OSError, ValueError):
+        pass  # unreadable or corrupt cache falls through to the live lookup
+
+    info = _fetch_account_info()
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(info, default=str))
+    except OSError:
+        pass  # read-only home directory just means no cross-process cache
+    return info
+
+
+@functools.lru_cache(maxsize=32)
 def get_base_arn(service_name: str, region: str = None, with_region: bool = True, with_account_id: bool = True):
+    # Cached for the life of the process: factories call this once per resource
+    # name, and without the cache each call pays the STS/IAM round-trips in
+    # get_account_info. lru_cache is thread-safe, so the thread pools that
+    # build resources concurrently share the warm entry.
     account_id = ''
     if with_region or with_account_id:
         caller_identity = get_account_info()
@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Iterable
+
+from aws_swiffer.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from aws_swiffer.resources.IResource import IResource
+    from aws_swiffer.utils.context import ExecutionContext
+
+logger = get_logger('BULK')
+
+
+def bulk_remove(resources: Iterable['IResource'], context: 'ExecutionContext' = None,
+                max_workers: int = 16) -> int:
+    """
+    Remove resources concurrently from a bounded thread pool.
+
+    Each remove() is a blocking AWS call, so running them one by one makes a
+    bulk teardown take the sum of the latencies; the pool brings it close to
+    the slowest call per batch. Failures are logged per resource instead of
+    aborting the batch, and the pool size bounds the request rate so adaptive
+    client retries can absorb throttling.
+
+    Args:
+        resources: Resources to remove; any iterable, consumed lazily
+        context: Optional ExecutionContext forwarded to each remove()
+        max_workers: Upper bound on concurrent removals
+
+    Returns:
+        Number of failed removals
+    """
+    failures = 0
+    success = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(resource.remove, context=context): resource
+                   for resource in resources}
+        for future in as_completed(futures):
+            try:
+                future.result()
+                success += 1
+            except Exception as e:
+                logger.error(f"Failed to remove resource {futures[future].arn}: {e}")
+                failures += 1
+    logger.info(f"Removal complete: {success} succeeded, {failures} failed")
+    return failures
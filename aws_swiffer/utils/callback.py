@@ -1,6 +1,7 @@
 import os
 
 from aws_swiffer.utils import get_logger, get_account_info, no_yes_dialog
+from aws_swiffer.utils.region import invalidate_region
 from aws_swiffer.utils.context import ExecutionContext
 
 
@@ -16,8 +17,11 @@ def callback_base(profile: str = None, region: str = 'eu-west-1',
     Powerful cli for remove AWS resources! Powered by Epsilon Team.
     """
     # Use environment variable for configure aws sdk without pass configuration
+    # Fallback for clients not built through get_client
+    os.environ.setdefault('AWS_RETRY_MODE', 'adaptive')
     if region and not os.getenv('AWS_REGION'):
         os.environ['AWS_REGION'] = region
+        invalidate_region()
     if profile and not os.getenv('AWS_PROFILE'):
         os.environ['AWS_PROFILE'] = profile
     if skip_account_check:
@@ -45,8 +49,15 @@ def callback_check_account(profile: str = None, region: str = 'eu-west-1', skip_
     confirm_account()
 
 
+# Account is confirmed at most once per process: composed invocations hit
+# confirm_account through both the root and service callbacks, and each check
+# costs an STS round-trip plus a dialog
+account_confirmed = False
+
+
 def confirm_account():
-    if os.getenv('SKIP_ACCOUNT_CHECK', 'false').lower() == 'true':
+    global account_confirmed
+    if account_confirmed or os.getenv('SKIP_ACCOUNT_CHECK', 'false').lower() == 'true':
         return
     else:
         try:
@@ -64,3 +75,4 @@ def confirm_account():
     if not continue_execution:
         logger.error("Action aborted!")
         exit(-1)
+    account_confirmed = True
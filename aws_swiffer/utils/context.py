@@ -13,11 +13,13 @@ class ExecutionContext:
         auto_approve: If True, skip confirmation prompts for destructive operations
         region: AWS region for operations
         profile: AWS profile to use for authentication
+        max_workers: Maximum number of threads used for batch removals
     """
     dry_run: bool = False
     auto_approve: bool = False
     region: Optional[str] = None
     profile: Optional[str] = None
+    max_workers: Optional[int] = None
     context: 'ExecutionContext' = None
     
     @classmethod
@@ -54,6 +56,7 @@ class ExecutionContext:
             dry_run=os.getenv('DRY_RUN', 'false').lower() == 'true',
             auto_approve=os.getenv('AUTO_APPROVE', 'false').lower() == 'true',
             region=os.getenv('AWS_REGION'),
-            profile=os.getenv('AWS_PROFILE')
+            profile=os.getenv('AWS_PROFILE'),
+            max_workers=int(os.getenv('MAX_WORKERS')) if os.getenv('MAX_WORKERS') else None
         )
     
\ No newline at end of file
@@ -1,6 +1,13 @@
+import functools
 import re
 
+# Compiled once at import instead of per call
+_ARN_RE = re.compile(r"^arn:(?P<Partition>[^:\n]*):(?P<Service>[^:\n]*):(?P<Region>[^:\n]*):(?P<AccountID>[^:\n]*):"
+                     r"(?P<Ignore>(?P<ResourceType>[^:\/\n]*)[:\/])?(?P<Resource>.*)$")
+
+
+@functools.lru_cache(maxsize=4096)
 def validate_arn(arn: str):
-    arn_re = (r"^arn:(?P<Partition>[^:\n]*):(?P<Service>[^:\n]*):(?P<Region>[^:\n]*):(?P<AccountID>[^:\n]*):"
-              r"(?P<Ignore>(?P<ResourceType>[^:\/\n]*)[:\/])?(?P<Resource>.*)$")
-    return re.match(arn, arn_re)
+    # Pure function of the string, so repeated ARNs (common in list files)
+    # are validated once
+    return _ARN_RE.match(arn)
@@ -75,12 +75,21 @@ def parse_input_tags(tags: str) -> dict:
     return json.loads(t)
 
 
+# Tag parses and the GUI selection are cached per process: the same tag input
+# is reused across subcommands, and the GUI should not prompt again for it
+parsed_tags = {}
+gui_tags = None
+
+
 def get_tags(tags: str = None) -> dict:
+    global gui_tags
     if not tags:
-        tags = prompt_input_tags()
-    else:
-        tags = parse_input_tags(tags)
-    return tags
+        if gui_tags is None:
+            gui_tags = prompt_input_tags()
+        return gui_tags
+    if tags not in parsed_tags:
+        parsed_tags[tags] = parse_input_tags(tags)
+    return parsed_tags[tags]
 
 
 def ask_delete_confirm(resource_name: str, context: 'ExecutionContext' = None) -> bool:
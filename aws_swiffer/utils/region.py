@@ -0,0 +1,32 @@
+import os
+
+# Resolved once per process: resource construction is a hot path and reading
+# AWS_REGION from the environment on every instantiation adds up across large
+# batches. The root callback invalidates the cache when it rewrites the
+# environment.
+_region = None
+_region_resolved = False
+
+
+def current_region(default: str = None) -> str:
+    """
+    Return the AWS_REGION environment value, cached for the process.
+
+    Args:
+        default: Value to return when AWS_REGION is not set
+
+    Returns:
+        The cached region, or the given default
+    """
+    global _region, _region_resolved
+    if not _region_resolved:
+        _region = os.getenv('AWS_REGION')
+        _region_resolved = True
+    return _region if _region is not None else default
+
+
+def invalidate_region() -> None:
+    """Drop the cached region so the next lookup re-reads the environment."""
+    global _region, _region_resolved
+    _region = None
+    _region_resolved = False